@@ -14,6 +14,85 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Full database schema, applied atomically in a single executescript call
+SCHEMA = '''
+    BEGIN;
+
+    CREATE TABLE IF NOT EXISTS authentication (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id TEXT UNIQUE NOT NULL,
+        project_id TEXT,
+        auth_provider TEXT NOT NULL,
+        access_token TEXT,
+        refresh_token TEXT,
+        token_expires_at TIMESTAMP,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        is_active BOOLEAN DEFAULT 1
+    );
+
+    CREATE TABLE IF NOT EXISTS configuration (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        key TEXT UNIQUE NOT NULL,
+        value TEXT,
+        description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS user_sessions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id TEXT UNIQUE NOT NULL,
+        user_id TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        is_active BOOLEAN DEFAULT 1,
+        FOREIGN KEY (user_id) REFERENCES authentication (user_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS audit_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id TEXT,
+        action TEXT NOT NULL,
+        details TEXT,
+        ip_address TEXT,
+        user_agent TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- get_auth_data: most recent active login
+    CREATE INDEX IF NOT EXISTS idx_authentication_active_updated
+        ON authentication (is_active, updated_at);
+
+    -- cleanup_old_sessions: stale active sessions
+    CREATE INDEX IF NOT EXISTS idx_user_sessions_active_accessed
+        ON user_sessions (is_active, last_accessed);
+
+    -- get_audit_log: per-user and global newest-first listings
+    CREATE INDEX IF NOT EXISTS idx_audit_log_user_created
+        ON audit_log (user_id, created_at);
+    CREATE INDEX IF NOT EXISTS idx_audit_log_created
+        ON audit_log (created_at);
+
+    COMMIT;
+'''
+
+# First characters a JSON-encoded configuration value can start with,
+# including the NaN and Infinity literals json.dumps emits for non-finite floats
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
+
+def _decode_config_value(value: Optional[str]) -> Any:
+    """Decode a stored configuration value, falling back to the raw string"""
+    # Plain strings are stored as-is by set_config, so skip the JSON parse
+    # entirely when the value cannot possibly be JSON
+    if not value or value[0] not in _JSON_START_CHARS:
+        return value
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return value
+
 class DatabaseManager:
     """Manages SQLite database operations for the Nebula CLI"""
     
@@ -26,90 +105,39 @@ class DatabaseManager:
             db_path = str(nebula_dir / 'nebula_cli.db')
         
         self.db_path = db_path
-        self.logger = logging.getLogger(__name__)
+        # An in-memory database only lives as long as its connection, so keep a
+        # single connection open and hand it out from get_connection
+        self._memory_conn = sqlite3.connect(db_path, check_same_thread=False) if db_path == ':memory:' else None
         self._init_database()
     
     def _init_database(self):
         """Initialize database with required tables"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Create authentication table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS authentication (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        user_id TEXT UNIQUE NOT NULL,
-                        project_id TEXT,
-                        auth_provider TEXT NOT NULL,
-                        access_token TEXT,
-                        refresh_token TEXT,
-                        token_expires_at TIMESTAMP,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        is_active BOOLEAN DEFAULT 1
-                    )
-                ''')
-                
-                # Create configuration table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS configuration (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        key TEXT UNIQUE NOT NULL,
-                        value TEXT,
-                        description TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-                
-                # Create user sessions table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS user_sessions (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        session_id TEXT UNIQUE NOT NULL,
-                        user_id TEXT NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        is_active BOOLEAN DEFAULT 1,
-                        FOREIGN KEY (user_id) REFERENCES authentication (user_id)
-                    )
-                ''')
-                
-                # Create audit log table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS audit_log (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        user_id TEXT,
-                        action TEXT NOT NULL,
-                        details TEXT,
-                        ip_address TEXT,
-                        user_agent TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-                
-                conn.commit()
-                self.logger.info(f"Database initialized at {self.db_path}")
+            with self.get_connection() as conn:
+                # executescript commits implicitly, so no explicit commit is needed
+                conn.executescript(SCHEMA)
+                logger.info(f"Database initialized at {self.db_path}")
                 
         except sqlite3.Error as e:
-            self.logger.error(f"Database initialization error: {e}")
+            logger.error(f"Database initialization error: {e}")
             raise
     
     def get_connection(self):
         """Get database connection"""
+        if self._memory_conn is not None:
+            return self._memory_conn
         return sqlite3.connect(self.db_path)
     
     def execute_query(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         """Execute a SELECT query and return results as list of dictionaries"""
         try:
             with self.get_connection() as conn:
-                conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
                 cursor.execute(query, params)
                 return [dict(row) for row in cursor.fetchall()]
         except sqlite3.Error as e:
-            self.logger.error(f"Query execution error: {e}")
+            logger.error(f"Query execution error: {e}")
             raise
     
     def execute_update(self, query: str, params: tuple = ()) -> int:
@@ -121,7 +149,7 @@ class DatabaseManager:
                 conn.commit()
                 return cursor.rowcount
         except sqlite3.Error as e:
-            self.logger.error(f"Update execution error: {e}")
+            logger.error(f"Update execution error: {e}")
             raise
     
     # Authentication methods
@@ -140,10 +168,10 @@ class DatabaseManager:
                      refresh_token, token_expires_at)
             
             self.execute_update(query, params)
-            self.logger.info(f"Authentication data stored for user: {user_id}")
+            logger.info(f"Authentication data stored for user: {user_id}")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to store auth data: {e}")
+            logger.error(f"Failed to store auth data: {e}")
             return False
     
     def get_auth_data(self, user_id: str = None) -> Optional[Dict[str, Any]]:
@@ -167,7 +195,7 @@ class DatabaseManager:
             results = self.execute_query(query, params)
             return results[0] if results else None
         except Exception as e:
-            self.logger.error(f"Failed to get auth data: {e}")
+            logger.error(f"Failed to get auth data: {e}")
             return None
     
     def is_authenticated(self) -> bool:
@@ -181,10 +209,10 @@ class DatabaseManager:
             try:
                 expires_at = datetime.fromisoformat(auth_data['token_expires_at'])
                 if datetime.now() >= expires_at:
-                    self.logger.info("Authentication token expired")
+                    logger.info("Authentication token expired")
                     return False
             except ValueError:
-                self.logger.warning("Invalid token expiration format")
+                logger.warning("Invalid token expiration format")
         
         return True
     
@@ -208,11 +236,11 @@ class DatabaseManager:
             
             affected_rows = self.execute_update(query, params)
             if affected_rows > 0:
-                self.logger.info(f"User logged out: {user_id or 'all users'}")
+                logger.info(f"User logged out: {user_id or 'all users'}")
                 return True
             return False
         except Exception as e:
-            self.logger.error(f"Failed to logout: {e}")
+            logger.error(f"Failed to logout: {e}")
             return False
     
     # Configuration methods
@@ -231,10 +259,10 @@ class DatabaseManager:
             params = (key, value, description)
             
             self.execute_update(query, params)
-            self.logger.info(f"Configuration set: {key}")
+            logger.info(f"Configuration set: {key}")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to set config: {e}")
+            logger.error(f"Failed to set config: {e}")
             return False
     
     def get_config(self, key: str, default: Any = None) -> Any:
@@ -246,37 +274,21 @@ class DatabaseManager:
             if not results:
                 return default
             
-            value = results[0]['value']
-            
-            # Try to parse as JSON, fallback to string
-            try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                return value
+            return _decode_config_value(results[0]['value'])
         except Exception as e:
-            self.logger.error(f"Failed to get config: {e}")
+            logger.error(f"Failed to get config: {e}")
             return default
     
     def get_all_config(self) -> Dict[str, Any]:
         """Get all configuration values"""
         try:
             query = 'SELECT key, value FROM configuration'
-            results = self.execute_query(query)
-            
-            config = {}
-            for row in results:
-                key = row['key']
-                value = row['value']
-                
-                # Try to parse as JSON, fallback to string
-                try:
-                    config[key] = json.loads(value)
-                except (json.JSONDecodeError, TypeError):
-                    config[key] = value
-            
-            return config
+            with self.get_connection() as conn:
+                # Iterate plain tuple rows straight off the cursor instead of
+                # materialising sqlite3.Row dicts via execute_query
+                return {key: _decode_config_value(value) for key, value in conn.execute(query)}
         except Exception as e:
-            self.logger.error(f"Failed to get all config: {e}")
+            logger.error(f"Failed to get all config: {e}")
             return {}
     
     # Session methods
@@ -292,10 +304,10 @@ class DatabaseManager:
             '''
             self.execute_update(query, (session_id, user_id))
             
-            self.logger.info(f"Session created for user: {user_id}")
+            logger.info(f"Session created for user: {user_id}")
             return session_id
         except Exception as e:
-            self.logger.error(f"Failed to create session: {e}")
+            logger.error(f"Failed to create session: {e}")
             return None
     
     def update_session(self, session_id: str) -> bool:
@@ -309,7 +321,7 @@ class DatabaseManager:
             affected_rows = self.execute_update(query, (session_id,))
             return affected_rows > 0
         except Exception as e:
-            self.logger.error(f"Failed to update session: {e}")
+            logger.error(f"Failed to update session: {e}")
             return False
     
     def end_session(self, session_id: str) -> bool:
@@ -323,7 +335,7 @@ class DatabaseManager:
             affected_rows = self.execute_update(query, (session_id,))
             return affected_rows > 0
         except Exception as e:
-            self.logger.error(f"Failed to end session: {e}")
+            logger.error(f"Failed to end session: {e}")
             return False
     
     # Audit logging
@@ -339,7 +351,7 @@ class DatabaseManager:
             self.execute_update(query, params)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to log action: {e}")
+            logger.error(f"Failed to log action: {e}")
             return False
     
     def get_audit_log(self, user_id: str = None, limit: int = 100) -> List[Dict[str, Any]]:
@@ -363,7 +375,7 @@ class DatabaseManager:
             
             return self.execute_query(query, params)
         except Exception as e:
-            self.logger.error(f"Failed to get audit log: {e}")
+            logger.error(f"Failed to get audit log: {e}")
             return []
     
     def cleanup_old_sessions(self, days: int = 30) -> int:
@@ -377,8 +389,8 @@ class DatabaseManager:
             '''.format(days)
             
             affected_rows = self.execute_update(query)
-            self.logger.info(f"Cleaned up {affected_rows} old sessions")
+            logger.info(f"Cleaned up {affected_rows} old sessions")
             return affected_rows
         except Exception as e:
-            self.logger.error(f"Failed to cleanup sessions: {e}")
+            logger.error(f"Failed to cleanup sessions: {e}")
             return 0
@@ -1,98 +1,261 @@
 import json
+import mmap
 import os
+import re
+import shlex
+import tempfile
 from pathlib import Path
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _json_loads(data):
+    """Decodes JSON from bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """Encodes obj as compact UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# Matches "Host <patterns>" lines, capturing the patterns without any trailing comment
+_HOST_RE = re.compile(r'^[ \t]*Host[ \t]+(.+?)[ \t]*(?:#.*)?$', re.IGNORECASE | re.MULTILINE)
+# Bytes variant of _HOST_RE for scanning memory-mapped configs
+_HOST_RE_BYTES = re.compile(rb'^[ \t]*Host[ \t]+(.+?)[ \t]*(?:#.*)?$', re.IGNORECASE | re.MULTILINE)
+# Configs larger than this are scanned through mmap rather than read into memory
+_MMAP_THRESHOLD = 64 * 1024
+# Option lines rewritten inside a Host block by update_ssh_host, capturing the keyword and value
+_OPTION_LINE_RE = re.compile(
+    r'^[ \t]*(HostName|User|IdentityFile)\b[ \t]*(?:=[ \t]*)?(.*?)[ \t]*$', re.IGNORECASE | re.MULTILINE
+)
+
+
+def _split_host_patterns(patterns):
+    """Splits a Host line's patterns, honouring double-quoted patterns like ssh does."""
+    if '"' in patterns:
+        try:
+            return shlex.split(patterns)
+        except ValueError:
+            pass  # Unbalanced quotes: fall back to plain whitespace splitting
+    return patterns.split()
+
+
+def _unquote(value):
+    """Strips the double quotes ssh allows around an option value."""
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1]
+    return value
+
+
+def _new_file_mode():
+    """Returns the mode a plainly created file would get under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _atomic_write(path, data):
+    """Writes bytes to a temporary sibling file and atomically renames it over path.
+
+    A symlinked path is resolved first so the link survives and its target is updated.
+    An existing file keeps its permissions; a new one gets the umask's default mode.
+    """
+    target = os.path.realpath(path)
+    try:
+        mode = os.stat(target).st_mode & 0o777
+    except FileNotFoundError:
+        mode = _new_file_mode()
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix=os.path.basename(target) + ".")
+    try:
+        try:
+            os.fchmod(fd, mode)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 class SSHConfigManager:
-    def __init__(self):
-        self.config_dir = Path.home() / ".config" / "nebula-cli"
+    # Config directories already created by this process
+    _created_dirs = set()
+
+    def __init__(self, home=None):
+        # Resolve the home directory once; Path.home() does a passwd lookup
+        home = Path(home) if home is not None else Path.home()
+        self.config_dir = home / ".config" / "nebula-cli"
         self.mappings_file = self.config_dir / "mappings.json"
-        self.ssh_config_file = Path.home() / ".ssh" / "config"
+        self.ssh_config_file = home / ".ssh" / "config"
+        # Parsed host list, valid while the config file's (path, mtime, size) is unchanged
+        self._hosts_cache = None
+        self._hosts_cache_key = None
+        # Parsed mappings, valid while the mappings file's (path, mtime, size) is unchanged
+        self._mappings = None
+        self._mappings_key = None
         self._ensure_config_dir_exists()
 
     def _ensure_config_dir_exists(self):
         """Ensures the configuration directory exists."""
+        if self.config_dir in SSHConfigManager._created_dirs:
+            return
         self.config_dir.mkdir(parents=True, exist_ok=True)
+        SSHConfigManager._created_dirs.add(self.config_dir)
+
+    def _mappings_file_key(self):
+        """Returns the cache key for the current mappings file, or None if it is missing."""
+        try:
+            stat = os.stat(self.mappings_file)
+        except FileNotFoundError:
+            return None
+        return (self.mappings_file, stat.st_mtime_ns, stat.st_size)
+
+    def _load_mappings(self):
+        """Returns the cached mappings, re-reading the file only when it has changed."""
+        key = self._mappings_file_key()
+        if key is None:
+            return {}
+        if key != self._mappings_key:
+            self._mappings = _json_loads(self.mappings_file.read_bytes())
+            self._mappings_key = key
+        return self._mappings
 
     def get_mappings(self):
         """Reads the instance ID to hostname mappings."""
-        if not self.mappings_file.exists():
-            return {}
-        with open(self.mappings_file, "r") as f:
-            return json.load(f)
+        return dict(self._load_mappings())
 
     def save_mappings(self, mappings):
         """Saves the instance ID to hostname mappings."""
-        with open(self.mappings_file, "w") as f:
-            json.dump(mappings, f, indent=2)
+        data = _json_dumps(mappings)
+        try:
+            _atomic_write(self.mappings_file, data)
+        except FileNotFoundError:
+            # The config directory was removed after this process created it
+            SSHConfigManager._created_dirs.discard(self.config_dir)
+            self._ensure_config_dir_exists()
+            _atomic_write(self.mappings_file, data)
+        self._mappings = dict(mappings)
+        self._mappings_key = self._mappings_file_key()
 
     def get_hostname_for_instance(self, instance_id):
         """Gets the hostname for a given instance ID."""
-        mappings = self.get_mappings()
-        return mappings.get(instance_id)
+        # Read straight from the mtime-validated cache; no copy is needed for a lookup
+        return self._load_mappings().get(instance_id)
 
     def set_hostname_for_instance(self, instance_id, hostname):
         """Sets the hostname for a given instance ID."""
+        self.set_hostnames({instance_id: hostname})
+
+    def set_hostnames(self, updates):
+        """Sets hostnames for several instance IDs with a single read and write."""
         mappings = self.get_mappings()
-        mappings[instance_id] = hostname
+        mappings.update(updates)
         self.save_mappings(mappings)
 
     def get_ssh_hosts(self):
         """Parses the SSH config file and returns a list of hosts."""
-        if not self.ssh_config_file.exists():
+        try:
+            stat = os.stat(self.ssh_config_file)
+        except FileNotFoundError:
             return []
-        
-        hosts = []
-        with open(self.ssh_config_file, "r") as f:
-            for line in f:
-                if line.strip().lower().startswith("host "):
-                    parts = line.strip().split()
-                    if len(parts) > 1:
-                        hosts.extend(p for p in parts[1:] if p != "*")
-        return hosts
+
+        cache_key = (self.ssh_config_file, stat.st_mtime_ns, stat.st_size)
+        if cache_key == self._hosts_cache_key:
+            return list(self._hosts_cache)
+
+        patterns = (
+            pattern
+            for line_patterns in self._read_host_lines(stat.st_size)
+            for pattern in _split_host_patterns(line_patterns)
+        )
+        # dict.fromkeys drops repeated hosts while keeping first-seen order
+        hosts = [pattern for pattern in dict.fromkeys(patterns) if pattern != "*"]
+
+        self._hosts_cache = hosts
+        self._hosts_cache_key = cache_key
+        return list(hosts)
+
+    def _read_host_lines(self, size):
+        """Returns the patterns of every Host line in the SSH config file."""
+        if size <= _MMAP_THRESHOLD:
+            return _HOST_RE.findall(self.ssh_config_file.read_bytes().decode("utf-8"))
+
+        # Scan large configs in place instead of copying the whole file into memory
+        with open(self.ssh_config_file, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [patterns.decode("utf-8") for patterns in _HOST_RE_BYTES.findall(mm)]
+
+    def _invalidate_hosts_cache(self):
+        """Forces the next get_ssh_hosts call to re-read the SSH config file."""
+        self._hosts_cache_key = None
 
     def update_ssh_host(self, host, hostname, user, key_path):
         """Updates an existing host in the SSH config file."""
-        if not self.ssh_config_file.exists():
+        self._invalidate_hosts_cache()
+        try:
+            text = self.ssh_config_file.read_bytes().decode("utf-8")
+        except FileNotFoundError:
             self.add_ssh_host(host, hostname, user, key_path)
             return
 
-        with open(self.ssh_config_file, "r") as f:
-            lines = f.readlines()
-
-        new_lines = []
-        in_host_block = False
-        host_found = False
-        for line in lines:
-            if line.strip().lower().startswith(f"host {host.lower()}"):
-                in_host_block = True
-                host_found = True
-                new_lines.append(line)
-            elif in_host_block and line.strip().lower().startswith("host "):
-                in_host_block = False
-                new_lines.append(line)
-            elif in_host_block:
-                if "hostname" in line.lower():
-                    new_lines.append(f"  HostName {hostname}\n")
-                elif "user" in line.lower():
-                    new_lines.append(f"  User {user}\n")
-                elif "identityfile" in line.lower():
-                    new_lines.append(f"  IdentityFile {key_path}\n")
-                else:
-                    new_lines.append(line)
-            else:
-                new_lines.append(line)
-        
-        if not host_found:
+        # Each Host block runs from the end of its Host line to the next Host line
+        host_lines = list(_HOST_RE.finditer(text))
+        # Case-folded pattern -> index of the first Host line declaring it
+        host_index = {}
+        for i, match in enumerate(host_lines):
+            for pattern in _split_host_patterns(match.group(1)):
+                host_index.setdefault(pattern.casefold(), i)
+
+        index = host_index.get(host.casefold())
+        if index is None:
             self.add_ssh_host(host, hostname, user, key_path)
             return
 
-        with open(self.ssh_config_file, "w") as f:
-            f.writelines(new_lines)
+        body_start = host_lines[index].end()
+        body_end = host_lines[index + 1].start() if index + 1 < len(host_lines) else len(text)
+        options = {
+            "hostname": ("HostName", hostname),
+            "user": ("User", user),
+            "identityfile": ("IdentityFile", key_path),
+        }
+
+        def rewrite(match):
+            keyword, value = options[match.group(1).lower()]
+            # Lines already holding the wanted value keep their own indentation and spelling
+            if _unquote(match.group(2)) == value:
+                return match.group(0)
+            return f"  {keyword} {value}"
+
+        body = text[body_start:body_end]
+        new_body = _OPTION_LINE_RE.sub(rewrite, body)
+        if new_body == body:
+            # Already up to date: skip the write so the file's mtime is preserved
+            return
+        new_text = text[:body_start] + new_body + text[body_end:]
+
+        # _atomic_write keeps the existing permissions; ssh refuses configs writable by others
+        _atomic_write(self.ssh_config_file, new_text.encode("utf-8"))
 
     def add_ssh_host(self, host, hostname, user, key_path):
         """Adds a new host to the SSH config file."""
-        with open(self.ssh_config_file, "a") as f:
-            f.write(f"\nHost {host}\n")
-            f.write(f"  HostName {hostname}\n")
-            f.write(f"  User {user}\n")
-            f.write(f"  IdentityFile {key_path}\n")
+        self._invalidate_hosts_cache()
+        block = f"\nHost {host}\n  HostName {hostname}\n  User {user}\n  IdentityFile {key_path}\n"
+        # One append-mode write per host; a newly created config gets ssh's expected 0600
+        fd = os.open(self.ssh_config_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(fd, block.encode("utf-8"))
+        finally:
+            os.close(fd)
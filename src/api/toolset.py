@@ -8,7 +8,8 @@ def get_toolset_info():
     
     if tools_dir.exists():
         for item in tools_dir.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
+            # Skip hidden directories and private ones such as __pycache__
+            if item.is_dir() and not item.name.startswith(('.', '_')):
                 if (item / "main.py").exists():
                     tools.append({"name": item.name, "status": "ready"})
                 else:
@@ -5,6 +5,7 @@ Focused on 4 core actions: start-vm, list-vms, stop-vm, update-ssh-config
 """
 
 import typer
+import os
 import sys
 import json
 import subprocess
@@ -24,12 +25,20 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from api.ssh_config_manager import SSHConfigManager
 
-console = Console()
+def create_console() -> Console:
+    """Create the CLI console, skipping styling work when output is not a terminal."""
+    if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+        # Scripted use (pipes, CI): no colour, highlighting or emoji substitution.
+        # Markup stays enabled since status messages are written with markup tags.
+        return Console(no_color=True, highlight=False, emoji=False)
+    return Console()
+
+console = create_console()
 app = typer.Typer(help="Simplified Nebula CLI for VM Management")
 
 class SimplifiedVMManager:
     def __init__(self):
-        self.console = Console()
+        self.console = console
         self.ssh_manager = SSHConfigManager()
         self.check_gcloud_auth()
     
@@ -177,7 +186,8 @@ class SimplifiedVMManager:
             
             machine_type = instance.get('machineType', 'Unknown').split('/')[-1]
             
-            table.add_row(name, status, zone, external_ip, machine_type)
+            # Text cells are rendered as-is, skipping per-cell markup parsing
+            table.add_row(Text(name), Text(status), Text(zone), Text(external_ip), Text(machine_type))
         
         self.console.print(table)
 
@@ -13,11 +13,7 @@ def temp_config_dir():
         yield Path(temp_dir)
 
 
-@pytest.fixture
-def temp_ssh_config():
-    """Create a temporary SSH config file for testing."""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.config') as f:
-        f.write("""Host test-host
+SSH_CONFIG_TEXT = """Host test-host
   HostName 192.168.1.100
   User testuser
   IdentityFile ~/.ssh/test_key
@@ -26,7 +22,22 @@ Host another-host
   HostName 192.168.1.101
   User anotheruser
   IdentityFile ~/.ssh/another_key
-""")
+"""
+
+
+@pytest.fixture(scope="session")
+def temp_ssh_config_shared(tmp_path_factory):
+    """Create a read-only SSH config file once for the whole test session."""
+    config_file = tmp_path_factory.mktemp("ssh") / "config"
+    config_file.write_text(SSH_CONFIG_TEXT, encoding='utf-8')
+    return config_file
+
+
+@pytest.fixture
+def temp_ssh_config():
+    """Create a temporary SSH config file for tests that modify it."""
+    with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False, suffix='.config') as f:
+        f.write(SSH_CONFIG_TEXT)
         temp_file = Path(f.name)
     
     yield temp_file
@@ -49,3 +60,26 @@ def ssh_config_manager(mock_home_dir):
     """Create an SSHConfigManager instance with mocked home directory."""
     from src.nebula_cli.ssh_config_manager import SSHConfigManager
     return SSHConfigManager()
+
+
+@pytest.fixture(scope="session")
+def shared_db():
+    """Create a single in-memory DatabaseManager for the whole test session."""
+    from src.api.database import DatabaseManager
+    return DatabaseManager(db_path=":memory:")
+
+
+@pytest.fixture
+def db_manager(shared_db):
+    """Provide the shared in-memory database, emptied again after each test."""
+    yield shared_db
+
+    # execute_update commits every statement, so clear the tables rather than
+    # rolling back to a savepoint
+    with shared_db.get_connection() as conn:
+        conn.executescript("""
+            DELETE FROM audit_log;
+            DELETE FROM user_sessions;
+            DELETE FROM configuration;
+            DELETE FROM authentication;
+        """)
@@ -0,0 +1,83 @@
+"""Unit tests for DatabaseManager class."""
+import math
+
+import pytest
+
+
+@pytest.mark.unit
+class TestDatabaseManager:
+    """Test cases for the DatabaseManager class."""
+
+    def test_schema_created(self, db_manager):
+        """Test that all tables and indexes exist after initialization."""
+        rows = db_manager.execute_query(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'index')"
+        )
+        names = {row['name'] for row in rows}
+
+        assert {"authentication", "configuration", "user_sessions", "audit_log"} <= names
+        assert "idx_authentication_active_updated" in names
+        assert "idx_audit_log_user_created" in names
+
+    def test_set_and_get_config(self, db_manager):
+        """Test config values round-trip with JSON decoding."""
+        assert db_manager.set_config("name", "nebula")
+        assert db_manager.set_config("settings", {"retries": 3})
+        assert db_manager.set_config("zones", ["us-central1-a"])
+
+        assert db_manager.get_config("name") == "nebula"
+        assert db_manager.get_config("settings") == {"retries": 3}
+        assert db_manager.get_config("zones") == ["us-central1-a"]
+        assert db_manager.get_config("missing", "default") == "default"
+
+    def test_get_all_config(self, db_manager):
+        """Test get_all_config decodes JSON values and keeps plain strings."""
+        db_manager.set_config("plain", "hello world")
+        db_manager.set_config("number", 42)
+        db_manager.set_config("flag", True)
+        db_manager.set_config("empty", "")
+        db_manager.set_config("not-json", "{broken")
+
+        assert db_manager.get_all_config() == {
+            "plain": "hello world",
+            "number": 42,
+            "flag": True,
+            "empty": "",
+            "not-json": "{broken",
+        }
+
+    def test_non_finite_floats_roundtrip(self, db_manager):
+        """Test NaN and infinities decode back to floats rather than strings."""
+        db_manager.set_config("nan", float('nan'))
+        db_manager.set_config("inf", float('inf'))
+        db_manager.set_config("neg-inf", float('-inf'))
+
+        config = db_manager.get_all_config()
+        assert math.isnan(config["nan"])
+        assert config["inf"] == float('inf')
+        assert config["neg-inf"] == float('-inf')
+        assert math.isnan(db_manager.get_config("nan"))
+        assert db_manager.get_config("inf") == float('inf')
+
+    def test_get_all_config_empty(self, db_manager):
+        """Test get_all_config starts empty for each test."""
+        assert db_manager.get_all_config() == {}
+
+    def test_auth_data_roundtrip(self, db_manager):
+        """Test storing and retrieving authentication data."""
+        assert db_manager.store_auth_data("user-1", "project-1", "api_key", "token")
+
+        auth_data = db_manager.get_auth_data("user-1")
+        assert auth_data['project_id'] == "project-1"
+        assert db_manager.is_authenticated()
+
+        assert db_manager.logout("user-1")
+        assert not db_manager.is_authenticated()
+
+    def test_audit_log(self, db_manager):
+        """Test audit log entries are recorded per user."""
+        db_manager.log_action("user-1", "login")
+        db_manager.log_action("user-2", "logout")
+
+        assert [entry['action'] for entry in db_manager.get_audit_log("user-1")] == ["login"]
+        assert len(db_manager.get_audit_log()) == 2
@@ -0,0 +1,257 @@
+"""Unit tests for the gcp_vm_manager tool's gcloud-backed listing and bulk operations."""
+import importlib.util
+import subprocess
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("questionary")
+
+TOOL_MAIN = Path(__file__).resolve().parents[2] / "tools" / "gcp_vm_manager" / "main.py"
+
+
+@pytest.fixture(scope="module")
+def gvm():
+    """Load the tool's main module from its script path."""
+    spec = importlib.util.spec_from_file_location("gcp_vm_manager_main", TOOL_MAIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeGcloud:
+    """Stands in for run_gcloud, recording commands and replying from queued results."""
+
+    def __init__(self):
+        self.calls = []
+        self.replies = {}
+
+    def reply(self, verb, stdout="", stderr="", returncode=0):
+        """Queue a reply for the next gcloud command whose verb (e.g. 'list', 'start') matches."""
+        self.replies.setdefault(verb, []).append((returncode, stdout, stderr))
+
+    def __call__(self, cmd, timeout, text=True, capture_stdout=True):
+        self.calls.append(cmd)
+        queued = self.replies.get(cmd[3], [])
+        returncode, stdout, stderr = queued.pop(0) if queued else (0, "", "")
+        return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
+
+    def commands(self, verb):
+        """Return the recorded commands with the given verb."""
+        return [cmd for cmd in self.calls if cmd[3] == verb]
+
+
+@pytest.fixture
+def gcloud(gvm, monkeypatch):
+    """Route the tool's gcloud calls to a FakeGcloud."""
+    fake = FakeGcloud()
+    monkeypatch.setattr(gvm, "run_gcloud", fake)
+    return fake
+
+
+@pytest.fixture
+def manager(gvm, gcloud, monkeypatch, tmp_path):
+    """Create a GCPVMManager without auth checks, sleeping or touching the real disk cache."""
+    monkeypatch.setattr(gvm, "DISK_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(gvm.GCPVMManager, "check_gcloud_auth", lambda self, force=False: None)
+    monkeypatch.setattr(gvm.time, "sleep", lambda seconds: None)
+    with gvm.GCPVMManager() as manager:
+        yield manager
+
+
+LISTING = (
+    "web-1,us-central1-a,RUNNING,e2-micro,10.0.0.2,34.1.2.3\n"
+    "web-2,us-central1-a,TERMINATED,e2-micro,10.0.0.3,\n"
+    "db-1,europe-west1-b,RUNNING,n2-standard-4,10.1.0.2,\n"
+)
+
+
+@pytest.mark.unit
+class TestListInstances:
+    """Test cases for GCPVMManager.list_instances."""
+
+    def test_parses_csv_rows(self, manager, gcloud):
+        """Test listing rows are mapped onto the flat list fields."""
+        gcloud.reply("list", LISTING)
+
+        instances = manager.list_instances("proj")
+
+        assert instances[0] == {
+            "name": "web-1",
+            "zone": "us-central1-a",
+            "status": "RUNNING",
+            "machineType": "e2-micro",
+            "networkIP": "10.0.0.2",
+            "natIP": "34.1.2.3",
+        }
+        assert instances[1]["natIP"] == ""
+        assert len(instances) == 3
+
+    def test_status_view_filters_fresh_snapshot(self, manager, gcloud):
+        """Test a status view is served from a fresh unfiltered listing without calling gcloud."""
+        gcloud.reply("list", LISTING)
+        manager.list_instances("proj")
+
+        running = manager.list_instances("proj", status="RUNNING")
+
+        assert [instance["name"] for instance in running] == ["web-1", "db-1"]
+        assert len(gcloud.commands("list")) == 1
+
+    def test_name_lookup_bypasses_snapshot(self, manager, gcloud):
+        """Test a name lookup is pushed to gcloud as a filter rather than served from the snapshot."""
+        gcloud.reply("list", LISTING)
+        manager.list_instances("proj")
+        gcloud.reply("list", "web-2,us-central1-a,TERMINATED,e2-micro,10.0.0.3,\n")
+
+        instances = manager.list_instances("proj", status="TERMINATED", name="web-2")
+
+        assert [instance["name"] for instance in instances] == ["web-2"]
+        command = gcloud.commands("list")[-1]
+        assert command[command.index("--filter") + 1] == "status=TERMINATED AND name=web-2"
+
+    def test_cache_expires_after_ttl(self, gvm, manager, gcloud):
+        """Test a listing older than LIST_CACHE_TTL is fetched again."""
+        gcloud.reply("list", LISTING)
+        manager.list_instances("proj")
+        manager.list_instances("proj")
+        assert len(gcloud.commands("list")) == 1
+
+        key = ("proj", None, None, None)
+        fetched_at, instances = manager._list_cache[key]
+        manager._list_cache[key] = (fetched_at - gvm.LIST_CACHE_TTL - 1, instances)
+        manager.list_instances("proj")
+
+        assert len(gcloud.commands("list")) == 2
+
+    def test_mutation_invalidates_caches(self, gvm, manager, gcloud):
+        """Test a start clears the in-memory and on-disk listings."""
+        manager.cache_ttl = 60
+        gcloud.reply("list", LISTING)
+        manager.list_instances("proj")
+        assert list(gvm.DISK_CACHE_DIR.rglob("*.json"))
+
+        manager.start_instance("web-2", "us-central1-a", "proj")
+
+        assert not manager._list_cache
+        assert not list(gvm.DISK_CACHE_DIR.rglob("*.json"))
+
+        manager.list_instances("proj")
+        assert len(gcloud.commands("list")) == 2
+
+    def test_mutation_keeps_other_projects_cached(self, gvm, manager, gcloud):
+        """Test a start only forgets listings of the project it changed."""
+        manager.cache_ttl = 60
+        gcloud.reply("list", LISTING)
+        gcloud.reply("list", LISTING)
+        manager.list_instances("proj")
+        manager.list_instances("other-proj")
+
+        manager.start_instance("web-2", "us-central1-a", "proj")
+
+        assert [key[0] for key in manager._list_cache] == ["other-proj"]
+        assert [path.parent.name for path in gvm.DISK_CACHE_DIR.rglob("*.json")] == ["other-proj"]
+
+    def test_mutation_leaves_disk_alone_when_disk_cache_off(self, gvm, manager, gcloud):
+        """Test a start does not touch saved listings when cache_ttl disables the disk cache."""
+        saved = gvm.DISK_CACHE_DIR / "proj" / "all-all-all.json"
+        saved.parent.mkdir(parents=True)
+        saved.write_text("[]")
+
+        manager.start_instance("web-2", "us-central1-a", "proj")
+
+        assert saved.exists()
+
+    def test_disk_cache_shared_between_managers(self, gvm, manager, gcloud):
+        """Test a listing saved by one run is reused by the next within cache_ttl."""
+        manager.cache_ttl = 60
+        gcloud.reply("list", LISTING)
+        first = manager.list_instances("proj")
+
+        with gvm.GCPVMManager(cache_ttl=60) as other:
+            second = other.list_instances("proj")
+
+        assert second == first
+        assert len(gcloud.commands("list")) == 1
+
+
+@pytest.mark.unit
+class TestBulkOperations:
+    """Test cases for the asynchronous bulk start/stop path."""
+
+    INSTANCES = [
+        {"name": "web-1", "zone": "us-central1-a"},
+        {"name": "web-2", "zone": "us-central1-a"},
+        {"name": "db-1", "zone": "europe-west1-b"},
+    ]
+
+    def _reply_submissions(self, gcloud, verb):
+        """Accept every submitted instance, naming each operation after its instance."""
+        def fake(cmd, timeout, text=True, capture_stdout=True):
+            if cmd[3] == verb:
+                gcloud.calls.append(cmd)
+                names = cmd[4:cmd.index("--zone")]
+                stdout = "".join(f"op-{name}\t{name}\n" for name in names)
+                return subprocess.CompletedProcess(cmd, 0, stdout, "")
+            return FakeGcloud.__call__(gcloud, cmd, timeout, text, capture_stdout)
+        return fake
+
+    def test_submits_one_batch_per_zone(self, gvm, manager, gcloud, monkeypatch):
+        """Test instances are grouped into one asynchronous submission per zone."""
+        monkeypatch.setattr(gvm, "run_gcloud", self._reply_submissions(gcloud, "start"))
+        gcloud.reply("list", "op-web-1\tDONE\t\nop-web-2\tDONE\t\nop-db-1\tDONE\t\n")
+
+        results = manager._run_parallel("start", self.INSTANCES, "proj")
+
+        batches = {cmd[cmd.index("--zone") + 1]: cmd[4:cmd.index("--zone")] for cmd in gcloud.commands("start")}
+        assert batches == {"us-central1-a": ["web-1", "web-2"], "europe-west1-b": ["db-1"]}
+        assert all("--async" in cmd for cmd in gcloud.commands("start"))
+        assert results == {"web-1": True, "web-2": True, "db-1": True}
+
+    def test_waits_on_every_collected_operation_together(self, gvm, manager, gcloud, monkeypatch):
+        """Test the collected operation names are polled with a single operations list filter."""
+        monkeypatch.setattr(gvm, "run_gcloud", self._reply_submissions(gcloud, "stop"))
+        gcloud.reply("list", "op-web-1\tDONE\t\nop-web-2\tDONE\t\nop-db-1\tDONE\t\n")
+
+        manager._run_parallel("stop", self.INSTANCES, "proj")
+
+        polls = [cmd for cmd in gcloud.commands("list") if cmd[2] == "operations"]
+        assert len(polls) == 1
+        assert polls[0][polls[0].index("--filter") + 1] == "name=(op-db-1 OR op-web-1 OR op-web-2)"
+
+    def test_failed_operation_reported(self, gvm, manager, gcloud, monkeypatch):
+        """Test an operation finishing with an error marks only its instance as failed."""
+        monkeypatch.setattr(gvm, "run_gcloud", self._reply_submissions(gcloud, "start"))
+        gcloud.reply("list", "op-web-1\tDONE\t\nop-web-2\tDONE\tQuota 'CPUS' exceeded\nop-db-1\tDONE\t\n")
+
+        results = manager._run_parallel("start", self.INSTANCES, "proj")
+
+        assert results == {"web-1": True, "web-2": False, "db-1": True}
+
+    def test_rejected_submission_fails_its_zone(self, manager, gcloud):
+        """Test a zone whose submission is rejected reports its instances as failed without polling."""
+        gcloud.reply("start", "", "ERROR: permission denied", returncode=1)
+
+        results = manager._run_parallel("start", self.INSTANCES[:2], "proj")
+
+        assert results == {"web-1": False, "web-2": False}
+        assert not gcloud.commands("list")
+
+    def test_rate_limited_retry_keeps_accepted_operations(self, manager, gcloud):
+        """Test a rate-limited batch resubmits only the instances without an operation."""
+        gcloud.reply("start", "op-web-1\tweb-1\n", "ERROR: rateLimitExceeded", returncode=1)
+        gcloud.reply("start", "op-web-2\tweb-2\n")
+
+        operations = manager._submit_power_operations("start", ["web-1", "web-2"], "us-central1-a", "proj")
+
+        assert operations == {"op-web-1": "web-1", "op-web-2": "web-2"}
+        retry = gcloud.commands("start")[1]
+        assert retry[4:retry.index("--zone")] == ["web-2"]
+
+    def test_permanent_error_not_retried(self, manager, gcloud):
+        """Test errors that merely contain 429 in a name are not treated as rate limits."""
+        gcloud.reply("start", "", "ERROR: instance 'worker-429' was not found", returncode=1)
+
+        operations = manager._submit_power_operations("start", ["worker-429"], "us-central1-a", "proj")
+
+        assert operations == {}
+        assert len(gcloud.commands("start")) == 1
@@ -105,8 +105,8 @@ class TestInstanceMapping:
         parsed_content = json.loads(content)
         assert parsed_content == test_mappings
         
-        # Verify file is properly formatted (indented)
-        assert "  " in content  # Should have indentation
+        # Verify file is written compactly
+        assert content == '{"instance-123":"web-server","instance-456":"db-server"}'
 
     def test_mappings_with_special_characters(self, ssh_config_manager):
         """Test mappings with special characters in hostnames."""
@@ -192,3 +192,6 @@ class TestInstanceMapping:
         for instance_id, hostname in unicode_mappings.items():
             ssh_config_manager.set_hostname_for_instance(instance_id, hostname)
             assert ssh_config_manager.get_hostname_for_instance(instance_id) == hostname
+
+        # Hostnames are stored as UTF-8 rather than \u escapes
+        assert "主机名" in ssh_config_manager.mappings_file.read_text(encoding="utf-8")
@@ -1,6 +1,7 @@
 """Unit tests for SSHConfigManager class."""
 import pytest
 import json
+import os
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
@@ -22,6 +23,25 @@ class TestSSHConfigManager:
             assert manager.mappings_file == temp_config_dir / ".config" / "nebula-cli" / "mappings.json"
             assert manager.ssh_config_file == temp_config_dir / ".ssh" / "config"
 
+    def test_init_with_explicit_home(self, temp_config_dir):
+        """Test __init__ uses an explicitly passed home directory."""
+        from src.nebula_cli.ssh_config_manager import SSHConfigManager
+
+        with patch('pathlib.Path.home') as mock_home:
+            manager = SSHConfigManager(home=temp_config_dir)
+            mock_home.assert_not_called()
+
+        assert manager.config_dir == temp_config_dir / ".config" / "nebula-cli"
+        assert manager.ssh_config_file == temp_config_dir / ".ssh" / "config"
+
+    def test_save_mappings_recreates_removed_config_directory(self, ssh_config_manager):
+        """Test save_mappings recreates a config directory removed after init."""
+        ssh_config_manager.config_dir.rmdir()
+
+        ssh_config_manager.save_mappings({"instance-1": "test-host"})
+
+        assert ssh_config_manager.get_mappings() == {"instance-1": "test-host"}
+
     def test_get_mappings_empty_file(self, ssh_config_manager):
         """Test get_mappings when mappings file doesn't exist."""
         mappings = ssh_config_manager.get_mappings()
@@ -50,6 +70,19 @@ class TestSSHConfigManager:
             saved_data = json.load(f)
         assert saved_data == mappings_data
 
+    def test_save_mappings_respects_umask(self, ssh_config_manager):
+        """Test a new mappings file gets the umask's default mode and an existing one keeps its mode."""
+        old_umask = os.umask(0o077)
+        try:
+            ssh_config_manager.save_mappings({"instance-1": "test-host"})
+        finally:
+            os.umask(old_umask)
+        assert ssh_config_manager.mappings_file.stat().st_mode & 0o777 == 0o600
+
+        ssh_config_manager.mappings_file.chmod(0o640)
+        ssh_config_manager.save_mappings({"instance-1": "updated-host"})
+        assert ssh_config_manager.mappings_file.stat().st_mode & 0o777 == 0o640
+
     def test_get_hostname_for_instance_existing(self, ssh_config_manager):
         """Test get_hostname_for_instance when mapping exists."""
         mappings_data = {"instance-1": "test-host", "instance-2": "another-host"}
@@ -58,6 +91,23 @@ class TestSSHConfigManager:
         hostname = ssh_config_manager.get_hostname_for_instance("instance-1")
         assert hostname == "test-host"
 
+    def test_get_mappings_reloads_after_external_change(self, ssh_config_manager):
+        """Test cached mappings are re-read when the file changes on disk."""
+        ssh_config_manager.save_mappings({"instance-1": "test-host"})
+        assert ssh_config_manager.get_mappings() == {"instance-1": "test-host"}
+
+        ssh_config_manager.mappings_file.write_text(json.dumps({"instance-1": "changed-host", "instance-2": "new-host"}))
+        assert ssh_config_manager.get_mappings() == {"instance-1": "changed-host", "instance-2": "new-host"}
+
+    def test_get_mappings_returns_copy(self, ssh_config_manager):
+        """Test mutating the returned mappings does not affect the cache."""
+        ssh_config_manager.save_mappings({"instance-1": "test-host"})
+
+        mappings = ssh_config_manager.get_mappings()
+        mappings["instance-2"] = "unsaved-host"
+
+        assert ssh_config_manager.get_mappings() == {"instance-1": "test-host"}
+
     def test_get_hostname_for_instance_not_existing(self, ssh_config_manager):
         """Test get_hostname_for_instance when mapping doesn't exist."""
         hostname = ssh_config_manager.get_hostname_for_instance("nonexistent")
@@ -89,14 +139,24 @@ class TestSSHConfigManager:
         mappings = ssh_config_manager.get_mappings()
         assert mappings == {"instance-1": "updated-host", "instance-2": "another-host"}
 
+    def test_set_hostnames_bulk_update(self, ssh_config_manager):
+        """Test set_hostnames merges several mappings in one write."""
+        ssh_config_manager.save_mappings({"instance-1": "test-host"})
+
+        with patch.object(ssh_config_manager, 'save_mappings', wraps=ssh_config_manager.save_mappings) as mock_save:
+            ssh_config_manager.set_hostnames({"instance-1": "updated-host", "instance-2": "new-host"})
+            assert mock_save.call_count == 1
+
+        assert ssh_config_manager.get_mappings() == {"instance-1": "updated-host", "instance-2": "new-host"}
+
     def test_get_ssh_hosts_no_config_file(self, ssh_config_manager):
         """Test get_ssh_hosts when SSH config file doesn't exist."""
         hosts = ssh_config_manager.get_ssh_hosts()
         assert hosts == []
 
-    def test_get_ssh_hosts_existing_file(self, ssh_config_manager, temp_ssh_config):
+    def test_get_ssh_hosts_existing_file(self, ssh_config_manager, temp_ssh_config_shared):
         """Test get_ssh_hosts parses existing SSH config file."""
-        with patch.object(ssh_config_manager, 'ssh_config_file', temp_ssh_config):
+        with patch.object(ssh_config_manager, 'ssh_config_file', temp_ssh_config_shared):
             hosts = ssh_config_manager.get_ssh_hosts()
             assert "test-host" in hosts
             assert "another-host" in hosts
@@ -132,6 +192,7 @@ Host another-host
         ssh_config_manager.add_ssh_host("new-host", "192.168.1.100", "testuser", "~/.ssh/test_key")
         
         assert ssh_config_path.exists()
+        assert ssh_config_path.stat().st_mode & 0o777 == 0o600
         content = ssh_config_path.read_text()
         assert "Host new-host" in content
         assert "HostName 192.168.1.100" in content
@@ -179,6 +240,106 @@ Host another-host
             assert "testuser" not in content
             assert "~/.ssh/test_key" not in content
 
+    def test_update_ssh_host_skips_write_when_unchanged(self, ssh_config_manager, temp_ssh_config):
+        """Test update_ssh_host does not rewrite the file when values already match."""
+        with patch.object(ssh_config_manager, 'ssh_config_file', temp_ssh_config):
+            mtime_before = temp_ssh_config.stat().st_mtime_ns
+
+            with patch('src.nebula_cli.ssh_config_manager._atomic_write') as mock_write:
+                ssh_config_manager.update_ssh_host("test-host", "192.168.1.100", "testuser", "~/.ssh/test_key")
+                mock_write.assert_not_called()
+
+            assert temp_ssh_config.stat().st_mtime_ns == mtime_before
+
+    def test_update_ssh_host_skips_write_for_hand_formatted_block(self, ssh_config_manager, temp_config_dir):
+        """Test matching values skip the write regardless of indentation, keyword case or quoting."""
+        ssh_config_path = temp_config_dir / "ssh_config"
+        ssh_config_path.write_text(
+            'Host test-host\n    hostname 192.168.1.100\n\tUser=testuser\n    IdentityFile "~/.ssh/test_key"\n'
+        )
+
+        with patch.object(ssh_config_manager, 'ssh_config_file', ssh_config_path):
+            with patch('src.nebula_cli.ssh_config_manager._atomic_write') as mock_write:
+                ssh_config_manager.update_ssh_host("test-host", "192.168.1.100", "testuser", "~/.ssh/test_key")
+                mock_write.assert_not_called()
+
+    def test_update_ssh_host_rewrites_only_changed_lines(self, ssh_config_manager, temp_config_dir):
+        """Test a changed value rewrites its own line and leaves matching lines as written."""
+        ssh_config_path = temp_config_dir / "ssh_config"
+        ssh_config_path.write_text("Host test-host\n    hostname 192.168.1.100\n    user testuser\n")
+
+        with patch.object(ssh_config_manager, 'ssh_config_file', ssh_config_path):
+            ssh_config_manager.update_ssh_host("test-host", "10.0.0.1", "testuser", "~/.ssh/test_key")
+
+        assert ssh_config_path.read_text() == "Host test-host\n  HostName 10.0.0.1\n    user testuser\n"
+
+    def test_update_ssh_host_follows_symlinked_config(self, ssh_config_manager, temp_config_dir):
+        """Test update_ssh_host rewrites a symlinked config's target and keeps the link."""
+        dotfiles = temp_config_dir / "dotfiles"
+        dotfiles.mkdir()
+        target = dotfiles / "ssh_config"
+        target.write_text("Host test-host\n  HostName 192.168.1.100\n  User testuser\n")
+        link = temp_config_dir / "ssh_config_link"
+        link.symlink_to(target)
+
+        with patch.object(ssh_config_manager, 'ssh_config_file', link):
+            ssh_config_manager.update_ssh_host("test-host", "10.0.0.1", "testuser", "~/.ssh/test_key")
+
+        assert link.is_symlink()
+        assert "HostName 10.0.0.1" in target.read_text()
+        assert [p.name for p in dotfiles.iterdir()] == ["ssh_config"]
+
+    def test_update_ssh_host_removes_temp_file_on_failure(self, ssh_config_manager, temp_ssh_config):
+        """Test a failed write leaves the config untouched and no temporary file behind."""
+        original = temp_ssh_config.read_text()
+
+        with patch.object(ssh_config_manager, 'ssh_config_file', temp_ssh_config):
+            with patch('src.nebula_cli.ssh_config_manager.os.replace', side_effect=OSError("disk full")):
+                with pytest.raises(OSError):
+                    ssh_config_manager.update_ssh_host("test-host", "10.0.0.1", "testuser", "~/.ssh/test_key")
+
+        assert temp_ssh_config.read_text() == original
+        assert not list(temp_ssh_config.parent.glob(temp_ssh_config.name + ".*"))
+
+    def test_update_ssh_host_only_touches_target_block(self, ssh_config_manager, temp_config_dir):
+        """Test update_ssh_host rewrites only the matching block's options."""
+        ssh_config_content = """Host alias-host target-host
+  HostName 192.168.1.100
+  User testuser
+  UserKnownHostsFile /dev/null
+  IdentityFile ~/.ssh/test_key
+
+Host target-host-2
+  HostName 192.168.1.101
+  User otheruser
+"""
+        ssh_config_path = temp_config_dir / "ssh_config"
+        ssh_config_path.write_text(ssh_config_content)
+
+        with patch.object(ssh_config_manager, 'ssh_config_file', ssh_config_path):
+            ssh_config_manager.update_ssh_host("target-host", "10.0.0.1", "newuser", "~/.ssh/new_key")
+
+        assert ssh_config_path.read_text() == """Host alias-host target-host
+  HostName 10.0.0.1
+  User newuser
+  UserKnownHostsFile /dev/null
+  IdentityFile ~/.ssh/new_key
+
+Host target-host-2
+  HostName 192.168.1.101
+  User otheruser
+"""
+
+    def test_update_ssh_host_replaces_file_atomically(self, ssh_config_manager, temp_ssh_config):
+        """Test update_ssh_host keeps file permissions and leaves no temporary file."""
+        temp_ssh_config.chmod(0o600)
+
+        with patch.object(ssh_config_manager, 'ssh_config_file', temp_ssh_config):
+            ssh_config_manager.update_ssh_host("test-host", "192.168.1.200", "updateduser", "~/.ssh/updated_key")
+
+        assert temp_ssh_config.stat().st_mode & 0o777 == 0o600
+        assert not list(temp_ssh_config.parent.glob(temp_ssh_config.name + ".*"))
+
     def test_update_ssh_host_creates_new_if_not_found(self, ssh_config_manager, temp_ssh_config):
         """Test update_ssh_host creates new host if not found."""
         with patch.object(ssh_config_manager, 'ssh_config_file', temp_ssh_config):
@@ -193,20 +354,26 @@ Host another-host
             assert "User newuser" in content
             assert "IdentityFile ~/.ssh/new_key" in content
 
-    def test_update_ssh_host_case_insensitive(self, ssh_config_manager):
+    def test_update_ssh_host_case_insensitive(self, ssh_config_manager, temp_config_dir):
         """Test update_ssh_host handles case insensitive host matching."""
         ssh_config_content = """Host Test-Host
   HostName 192.168.1.100
   User testuser
   IdentityFile ~/.ssh/test_key
 """
-        with patch.object(ssh_config_manager, 'ssh_config_file', Path('/tmp/test_config')):
-            with patch('builtins.open', mock_open(read_data=ssh_config_content)):
-                with patch('builtins.open', mock_open()) as mock_file:
-                    ssh_config_manager.update_ssh_host("test-host", "192.168.1.200", "updateduser", "~/.ssh/updated_key")
-                    
-                    # Verify the file was opened for writing
-                    assert mock_file.call_count >= 1
+        ssh_config_path = temp_config_dir / "ssh_config"
+        ssh_config_path.write_text(ssh_config_content)
+
+        with patch.object(ssh_config_manager, 'ssh_config_file', ssh_config_path):
+            ssh_config_manager.update_ssh_host("test-host", "192.168.1.200", "updateduser", "~/.ssh/updated_key")
+
+            content = ssh_config_path.read_text()
+            # The existing block is updated in place rather than a new host being appended
+            assert content.count("Host ") == 1
+            assert "Host Test-Host" in content
+            assert "HostName 192.168.1.200" in content
+            assert "User updateduser" in content
+            assert "IdentityFile ~/.ssh/updated_key" in content
 
     def test_ssh_config_parsing_edge_cases(self, ssh_config_manager, temp_config_dir):
         """Test SSH config parsing handles edge cases."""
@@ -236,6 +403,49 @@ Host * wildcard-host
             assert "*" not in hosts
             assert len(hosts) == 3
 
+    def test_get_ssh_hosts_deduplicates(self, ssh_config_manager, temp_config_dir):
+        """Test get_ssh_hosts lists hosts declared more than once only once."""
+        ssh_config_content = """Host test-host
+  HostName 192.168.1.100
+
+Host another-host test-host
+  User anotheruser
+"""
+        ssh_config_path = temp_config_dir / "ssh_config"
+        ssh_config_path.write_text(ssh_config_content)
+
+        with patch.object(ssh_config_manager, 'ssh_config_file', ssh_config_path):
+            assert ssh_config_manager.get_ssh_hosts() == ["test-host", "another-host"]
+
+    def test_get_ssh_hosts_quoted_patterns(self, ssh_config_manager, temp_config_dir):
+        """Test get_ssh_hosts keeps double-quoted host patterns intact."""
+        ssh_config_content = """Host "quoted host" plain-host
+  HostName 192.168.1.100
+
+Host "unbalanced
+  HostName 192.168.1.101
+"""
+        ssh_config_path = temp_config_dir / "ssh_config"
+        ssh_config_path.write_text(ssh_config_content)
+
+        with patch.object(ssh_config_manager, 'ssh_config_file', ssh_config_path):
+            hosts = ssh_config_manager.get_ssh_hosts()
+            assert hosts == ["quoted host", "plain-host", '"unbalanced']
+
+    def test_get_ssh_hosts_large_config(self, ssh_config_manager, temp_config_dir):
+        """Test get_ssh_hosts parses configs large enough to be memory-mapped."""
+        ssh_config_content = "".join(
+            f"Host host-{i}\n  HostName 10.0.{i // 256}.{i % 256}\n  User testuser\n\n"
+            for i in range(2000)
+        )
+        ssh_config_path = temp_config_dir / "ssh_config"
+        ssh_config_path.write_text(ssh_config_content)
+        assert ssh_config_path.stat().st_size > 64 * 1024
+
+        with patch.object(ssh_config_manager, 'ssh_config_file', ssh_config_path):
+            hosts = ssh_config_manager.get_ssh_hosts()
+            assert hosts == [f"host-{i}" for i in range(2000)]
+
     def test_mappings_persistence(self, ssh_config_manager):
         """Test that mappings persist across manager instances."""
         # Create first manager instance
@@ -250,3 +460,13 @@ Host * wildcard-host
             # Verify mapping persists
             hostname = manager2.get_hostname_for_instance("instance-1")
             assert hostname == "test-host"
+
+    def test_get_ssh_hosts_cache_invalidated_on_add(self, ssh_config_manager, temp_ssh_config):
+        """Test get_ssh_hosts serves cached hosts until the config changes."""
+        with patch.object(ssh_config_manager, 'ssh_config_file', temp_ssh_config):
+            first = ssh_config_manager.get_ssh_hosts()
+            second = ssh_config_manager.get_ssh_hosts()
+            assert first == second == ["test-host", "another-host"]
+
+            ssh_config_manager.add_ssh_host("new-host", "192.168.1.200", "newuser", "~/.ssh/new_key")
+            assert ssh_config_manager.get_ssh_hosts() == ["test-host", "another-host", "new-host"]
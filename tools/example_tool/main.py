@@ -8,26 +8,30 @@ import sys
 import os
 from pathlib import Path
 
+# Tool information never changes within a process, so compute it once at import
+TOOL_PATH = Path(__file__).parent
+TOOL_NAME = TOOL_PATH.name
+PYTHON_VERSION = sys.version
+
 def main():
     """Main function for the example tool."""
-    print("🔧 Example Tool - Nebula CLI Integration Demo")
-    print("=" * 50)
-    
-    # Get tool information
-    tool_path = Path(__file__).parent
-    tool_name = tool_path.name
-    
-    print(f"Tool Name: {tool_name}")
-    print(f"Tool Path: {tool_path}")
-    print(f"Python Version: {sys.version}")
-    print(f"Working Directory: {os.getcwd()}")
-    
-    print("\nThis is an example tool that demonstrates:")
-    print("- How tools can be structured in the Nebula toolset")
-    print("- How the CLI can discover and execute tools")
-    print("- How tools can provide their own functionality")
-    
-    print("\n✅ Example tool executed successfully!")
+    # Build the whole report first and emit it with a single write
+    lines = [
+        "🔧 Example Tool - Nebula CLI Integration Demo",
+        "=" * 50,
+        f"Tool Name: {TOOL_NAME}",
+        f"Tool Path: {TOOL_PATH}",
+        f"Python Version: {PYTHON_VERSION}",
+        f"Working Directory: {os.getcwd()}",
+        "",
+        "This is an example tool that demonstrates:",
+        "- How tools can be structured in the Nebula toolset",
+        "- How the CLI can discover and execute tools",
+        "- How tools can provide their own functionality",
+        "",
+        "✅ Example tool executed successfully!",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return 0
 
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+gcloud helpers shared by the GCP tools
+Runs gcloud with a consistent environment and decodes its JSON output
+"""
+
+import os
+import json
+import shutil
+import subprocess
+from functools import cache
+from typing import List, Optional
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+# Environment variables checked, in order, for the project ID before asking gcloud
+PROJECT_ENV_VARS = ("CLOUDSDK_CORE_PROJECT", "GOOGLE_CLOUD_PROJECT", "GOOGLE_PROJECT", "PROJECT_ID")
+
+# gcloud settings that skip update checks, surveys and usage reporting on every call;
+# values already present in the environment take precedence
+GCLOUD_DEFAULTS = {
+    "CLOUDSDK_COMPONENT_MANAGER_DISABLE_UPDATE_CHECK": "1",
+    "CLOUDSDK_CORE_DISABLE_PROMPTS": "1",
+    "CLOUDSDK_CORE_DISABLE_USAGE_REPORTING": "1",
+    "CLOUDSDK_SURVEY_DISABLE_PROMPTS": "1",
+}
+
+
+@cache
+def gcloud_bin() -> Optional[str]:
+    """Resolve the gcloud executable on PATH once per process."""
+    return shutil.which("gcloud")
+
+
+def run_gcloud(cmd: List[str], timeout: int, text: bool = True, capture_stdout: bool = True) -> subprocess.CompletedProcess:
+    """Run a gcloud command with captured stderr and the gcloud defaults added to the current environment.
+
+    stdout is discarded unless capture_stdout is set.
+    """
+    return subprocess.run(
+        [gcloud_bin() or cmd[0], *cmd[1:]],
+        stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=text,
+        timeout=timeout,
+        # Built per call so gcloud sees the same environment callers read their settings from
+        env={**GCLOUD_DEFAULTS, **os.environ}
+    )
+
+
+def json_loads(data):
+    """Decode JSON from bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
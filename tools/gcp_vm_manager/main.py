@@ -4,27 +4,169 @@ GCP VM Manager Tool
 Interactive tool for managing Google Cloud Platform VM instances
 """
 
+import os
+import random
 import sys
+import csv
 import json
 import subprocess
 import argparse
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Union
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 from rich import print as rprint
-import inquirer
+import questionary
 from pathlib import Path
 
+# The shared gcloud helpers live next to the tool directories
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from gcloud_common import PROJECT_ENV_VARS, gcloud_bin, json_loads, run_gcloud
+
 # Add src to path to import nebula_cli modules
 # sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 # from nebula_cli.ssh_config_manager import SSHConfigManager
 
 console = Console()
 
+# Menu entry that returns from instance selection without choosing an instance
+BACK_CHOICE = "← Back to main menu"
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer setting from the environment, warning and using default if it is invalid."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        console.print(f"[yellow]⚠️  Ignoring {name}={value!r}: not an integer; using {default}[/yellow]")
+        return default
+
+
+# Upper bound on concurrent gcloud calls issued by the bulk start/stop paths; kept
+# below the Compute Engine per-project request rate and overridable with GCP_MAX_CONCURRENCY
+MAX_PARALLEL_OPERATIONS = _env_int("GCP_MAX_CONCURRENCY", 16)
+
+# Times a rate-limited start/stop/create submission is retried before giving up
+SUBMIT_RETRIES = 5
+
+# stderr fragments gcloud reports when a request was rejected by API rate limits
+_RATE_LIMIT_MARKERS = ("rateLimitExceeded", "RATE_LIMIT_EXCEEDED", "Error 429", "code=429")
+
+# Overall deadline in seconds for a bulk start/stop batch
+BULK_OPERATION_TIMEOUT = 600
+
+# Seconds a list_instances result is reused before gcloud is queried again
+LIST_CACHE_TTL = 15
+
+# Listings shared between runs when --cache-ttl is set
+DISK_CACHE_DIR = Path.home() / ".cache" / "gcp_vm_manager"
+
+# Flat fields fetched by list_instances, in the column order of _LIST_FORMAT
+_LIST_FIELDS = ("name", "zone", "status", "machineType", "networkIP", "natIP")
+_LIST_FORMAT = (
+    "csv[no-heading](name,zone.basename(),status,machineType.basename(),"
+    "networkInterfaces[0].networkIP,networkInterfaces[0].accessConfigs[0].natIP)"
+)
+
+# Interactive list views: menu entry -> (status filter, table title)
+_LIST_VIEWS = {
+    'List All Instances': (None, "All VM Instances"),
+    'List Running Instances': ("RUNNING", "Running VM Instances"),
+    'List Terminated Instances': ("TERMINATED", "Terminated VM Instances"),
+}
+
+# Status polling backs off exponentially from POLL_BASE_DELAY up to POLL_MAX_DELAY seconds
+POLL_BASE_DELAY = 1.0
+POLL_MAX_DELAY = 15.0
+
+# Rich color for each instance status; anything else is shown in yellow
+_STATUS_COLOR = {"RUNNING": "green", "TERMINATED": "red"}
+
+# Seconds a cached gcloud auth check or project lookup stays valid
+GCLOUD_CACHE_TTL = 300
+
+_gcloud_cache: Dict[Tuple[str, tuple], Tuple[float, str]] = {}
+
+
+def _gcloud_config_fingerprint() -> tuple:
+    """Identify the active gcloud configuration so cached lookups follow config changes."""
+    config_dir = Path(os.environ.get("CLOUDSDK_CONFIG") or Path.home() / ".config" / "gcloud")
+    config_name = os.environ.get("CLOUDSDK_ACTIVE_CONFIG_NAME")
+    
+    if not config_name:
+        try:
+            config_name = (config_dir / "active_config").read_text(encoding="utf-8").strip()
+        except OSError:
+            config_name = "default"
+    
+    try:
+        mtime = (config_dir / "configurations" / f"config_{config_name}").stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    
+    return (config_name, mtime, os.environ.get("CLOUDSDK_CORE_PROJECT"), os.environ.get("CLOUDSDK_CORE_ACCOUNT"))
+
+
+def _is_rate_limited(stderr: Union[str, bytes]) -> bool:
+    """Return True if gcloud's stderr reports that the request was rejected by a rate limit."""
+    if isinstance(stderr, bytes):
+        stderr = stderr.decode("utf-8", "replace")
+    return any(marker in stderr for marker in _RATE_LIMIT_MARKERS)
+
+
+def _submit_gcloud(cmd: List[str], timeout: int, text: bool = True, capture_stdout: bool = True) -> subprocess.CompletedProcess:
+    """Run a state-changing gcloud command, retrying with backoff while it is rate limited."""
+    for attempt in range(SUBMIT_RETRIES):
+        result = run_gcloud(cmd, timeout=timeout, text=text, capture_stdout=capture_stdout)
+        if result.returncode == 0 or not _is_rate_limited(result.stderr):
+            return result
+        time.sleep(_poll_delay(attempt))
+    return run_gcloud(cmd, timeout=timeout, text=text, capture_stdout=capture_stdout)
+
+
+def _poll_delay(attempt: int) -> float:
+    """Return the jittered exponential backoff delay for a polling attempt."""
+    return min(POLL_MAX_DELAY, POLL_BASE_DELAY * 2 ** attempt) + random.uniform(0, 0.5)
+
+
+def _filter_instances(instances: List[Dict[str, Any]], status: Optional[str]) -> List[Dict[str, Any]]:
+    """Return the instances with the given status, or all of them when status is None."""
+    if status is None:
+        return instances
+    return [instance for instance in instances if instance.get('status') == status]
+
+
+def _make_instances_table(title: str) -> Table:
+    """Create an empty instances table with the standard columns."""
+    table = Table(title=title)
+    table.add_column("Name", style="cyan", no_wrap=True)
+    table.add_column("Zone", style="blue")
+    table.add_column("Status", style="green")
+    table.add_column("Machine Type", style="yellow")
+    table.add_column("Internal IP", style="magenta")
+    table.add_column("External IP", style="red")
+    return table
+
+
+def _get_cached(name: str) -> Optional[str]:
+    """Return a cached gcloud lookup if it is fresh and the configuration is unchanged."""
+    entry = _gcloud_cache.get((name, _gcloud_config_fingerprint()))
+    if entry and time.monotonic() - entry[0] < GCLOUD_CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def _set_cached(name: str, value: str):
+    """Store a gcloud lookup for the current configuration."""
+    _gcloud_cache[(name, _gcloud_config_fingerprint())] = (time.monotonic(), value)
+
 # def handle_ssh_config_update(instance_id: str, instance_name: str, external_ip: str, args: argparse.Namespace):
 #     """Handles the SSH config update process."""
 #     ssh_manager = SSHConfigManager()
@@ -80,17 +222,82 @@ console = Console()
 
 
 class GCPVMManager:
-    def __init__(self):
+    def __init__(self, force_auth_check: bool = False, use_cache: bool = True, cache_ttl: int = 0):
         self.console = Console()
-        self.check_gcloud_auth()
+        self.use_cache = use_cache
+        self.cache_ttl = cache_ttl
+        self._list_cache: Dict[Tuple[str, Optional[str], Optional[str], Optional[str]], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.check_gcloud_auth(force=force_auth_check)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def close(self):
+        """Shut down the worker threads used by bulk operations."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool shared by every bulk operation of this manager, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=MAX_PARALLEL_OPERATIONS)
+        return self._executor
+    
+    def _invalidate_caches(self, project_id: str):
+        """Forget a project's cached listings after a state-changing operation."""
+        self._list_cache = {key: entry for key, entry in self._list_cache.items() if key[0] != project_id}
+        
+        # Listings of this project saved by earlier runs are stale too
+        if self.use_cache and self.cache_ttl > 0:
+            for cache_file in (DISK_CACHE_DIR / project_id).glob("*.json"):
+                cache_file.unlink(missing_ok=True)
     
-    def check_gcloud_auth(self):
+    def _disk_cache_path(self, cache_key: Tuple[str, Optional[str], Optional[str], Optional[str]]) -> Optional[Path]:
+        """Return the on-disk cache file for a listing, or None when disk caching is off."""
+        if not self.use_cache or self.cache_ttl <= 0:
+            return None
+        project_id, *view = cache_key
+        return DISK_CACHE_DIR / project_id / ("-".join(part or "all" for part in view) + ".json")
+    
+    def _read_disk_cache(self, path: Path) -> Optional[List[Dict[str, str]]]:
+        """Load a cached listing saved by an earlier run if it is younger than cache_ttl."""
+        try:
+            if time.time() - path.stat().st_mtime >= self.cache_ttl:
+                return None
+            return json_loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+    
+    def _write_disk_cache(self, path: Path, instances: List[Dict[str, str]]):
+        """Save a listing for later runs, replacing any previous file atomically."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_text(json.dumps(instances, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # The disk cache is best effort
+    
+    def check_gcloud_auth(self, force: bool = False):
         """Check if gcloud is authenticated and configured."""
+        if not gcloud_bin():
+            self.console.print("[red]❌ gcloud CLI not found. Please install Google Cloud SDK first.[/red]")
+            self.console.print("[yellow]Install from: https://cloud.google.com/sdk/docs/install[/yellow]")
+            sys.exit(1)
+        
+        account = None if force else _get_cached("account")
+        if account:
+            self.console.print(f"[green]✅ Authenticated as: {account}[/green]")
+            return
+        
         try:
-            result = subprocess.run(
+            result = run_gcloud(
                 ["gcloud", "auth", "list", "--filter=status:ACTIVE", "--format=value(account)"],
-                capture_output=True,
-                text=True,
                 timeout=10
             )
             if result.returncode != 0 or not result.stdout.strip():
@@ -98,6 +305,7 @@ class GCPVMManager:
                 sys.exit(1)
             
             account = result.stdout.strip()
+            _set_cached("account", account)
             self.console.print(f"[green]✅ Authenticated as: {account}[/green]")
             
         except FileNotFoundError:
@@ -110,16 +318,20 @@ class GCPVMManager:
     
     def get_project_id(self) -> str:
         """Get the current GCP project ID."""
+        for env_var in PROJECT_ENV_VARS:
+            if os.environ.get(env_var):
+                return os.environ[env_var]
+        
+        project_id = _get_cached("project")
+        if project_id:
+            return project_id
+        
         try:
-            result = subprocess.run(
-                ["gcloud", "config", "get-value", "project"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            result = run_gcloud(["gcloud", "config", "get-value", "project"], timeout=10)
             if result.returncode == 0:
                 project_id = result.stdout.strip()
                 if project_id:
+                    _set_cached("project", project_id)
                     return project_id
         except Exception:
             pass
@@ -132,35 +344,67 @@ class GCPVMManager:
             sys.exit(1)
         return project_id
     
-    def list_instances(self, project_id: str, zone: Optional[str] = None, status: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List all VM instances in the project."""
+    def list_instances(self, project_id: str, zone: Optional[str] = None, status: Optional[str] = None, name: Optional[str] = None) -> List[Dict[str, str]]:
+        """List VM instances in the project as flat rows keyed by _LIST_FIELDS, optionally filtered by status and name."""
+        cache_key = (project_id, zone, status, name)
+        cached = self._list_cache.get(cache_key) if self.use_cache else None
+        if cached and time.monotonic() - cached[0] < LIST_CACHE_TTL:
+            instances = cached[1]
+            self.console.print(f"[green]✅ Found {len(instances)} instances[/green] [dim](cached)[/dim]")
+            return list(instances)
+        
+        # A fresh unfiltered listing already holds every status view, so filter it instead of asking gcloud again
+        snapshot = self._list_cache.get((project_id, zone, None, None)) if self.use_cache and status and not name else None
+        if snapshot and time.monotonic() - snapshot[0] < LIST_CACHE_TTL:
+            instances = _filter_instances(snapshot[1], status)
+            self.console.print(f"[green]✅ Found {len(instances)} instances[/green] [dim](cached)[/dim]")
+            return instances
+        
+        disk_path = self._disk_cache_path(cache_key)
+        instances = self._read_disk_cache(disk_path) if disk_path else None
+        if instances is not None:
+            self._list_cache[cache_key] = (time.monotonic(), instances)
+            self.console.print(f"[green]✅ Found {len(instances)} instances[/green] [dim](cached)[/dim]")
+            return list(instances)
+        
         try:
             cmd = [
                 "gcloud", "compute", "instances", "list",
                 "--project", project_id,
-                "--format", "json"
+                "--format", _LIST_FORMAT
             ]
             
             if zone:
                 cmd.extend(["--zones", zone])
             
+            filters = []
             if status:
-                cmd.extend(["--filter", f"status={status}"])
+                filters.append(f"status={status}")
+            if name:
+                filters.append(f"name={name}")
+            if filters:
+                cmd.extend(["--filter", " AND ".join(filters)])
             
-            print("gcloud command:", " ".join(cmd))
             self.console.print("[blue]🔍 Fetching VM instances...[/blue]")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = run_gcloud(cmd, timeout=30)
             
             if result.returncode != 0:
                 self.console.print(f"[red]❌ Failed to list instances: {result.stderr}[/red]")
                 return []
             
-            instances = json.loads(result.stdout)
+            instances = [
+                dict(zip(_LIST_FIELDS, row))
+                for row in csv.reader(result.stdout.splitlines())
+                if row
+            ]
+            self._list_cache[cache_key] = (time.monotonic(), instances)
+            if disk_path:
+                self._write_disk_cache(disk_path, instances)
             
             self.console.print(f"[green]✅ Found {len(instances)} instances[/green]")
-            return instances
+            return list(instances)
             
-        except json.JSONDecodeError:
+        except csv.Error:
             self.console.print("[red]❌ Failed to parse instance data[/red]")
             return []
         except subprocess.TimeoutExpired:
@@ -176,43 +420,19 @@ class GCPVMManager:
             self.console.print("[yellow]⚠️  No instances found.[/yellow]")
             return
         
-        table = Table(title=title)
-        table.add_column("Name", style="cyan", no_wrap=True)
-        table.add_column("Zone", style="blue")
-        table.add_column("Status", style="green")
-        table.add_column("Machine Type", style="yellow")
-        table.add_column("Internal IP", style="magenta")
-        table.add_column("External IP", style="red")
+        table = _make_instances_table(title)
         
         for instance in instances:
-            status = instance.get('status', 'UNKNOWN')
-            status_color = "green" if status == 'RUNNING' else "red" if status == 'TERMINATED' else "yellow"
-            
-            # Extract zone from full zone path
-            zone = instance.get('zone', '').split('/')[-1] if instance.get('zone') else 'N/A'
-            
-            # Extract machine type from full path
-            machine_type = instance.get('machineType', '').split('/')[-1] if instance.get('machineType') else 'N/A'
-            
-            # Get IP addresses
-            internal_ip = 'N/A'
-            external_ip = 'N/A'
-            
-            for network_interface in instance.get('networkInterfaces', []):
-                if not internal_ip or internal_ip == 'N/A':
-                    internal_ip = network_interface.get('networkIP', 'N/A')
-                if not external_ip or external_ip == 'N/A':
-                    access_configs = network_interface.get('accessConfigs', [])
-                    if access_configs:
-                        external_ip = access_configs[0].get('natIP', 'N/A')
+            status = instance.get('status') or 'UNKNOWN'
+            status_color = _STATUS_COLOR.get(status, "yellow")
             
             table.add_row(
-                instance.get('name', 'N/A'),
-                zone,
+                instance.get('name') or 'N/A',
+                instance.get('zone') or 'N/A',
                 f"[{status_color}]{status}[/{status_color}]",
-                machine_type,
-                internal_ip,
-                external_ip
+                instance.get('machineType') or 'N/A',
+                instance.get('networkIP') or 'N/A',
+                instance.get('natIP') or 'N/A'
             )
         
         self.console.print(table)
@@ -228,13 +448,13 @@ class GCPVMManager:
                 "--format", "json"
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = run_gcloud(cmd, timeout=30, text=False)
             
             if result.returncode != 0:
-                self.console.print(f"[red]❌ Failed to get instance details: {result.stderr}[/red]")
+                self.console.print(f"[red]❌ Failed to get instance details: {result.stderr.decode('utf-8', 'replace')}[/red]")
                 return None
             
-            return json.loads(result.stdout)
+            return json_loads(result.stdout)
             
         except json.JSONDecodeError:
             self.console.print("[red]❌ Failed to parse instance data[/red]")
@@ -252,39 +472,35 @@ class GCPVMManager:
             self.console.print("[yellow]No instances available for selection.[/yellow]")
             return None
         
-        # Create choices for inquirer
+        # Create choices for questionary
         choices = []
-        for i, instance in enumerate(instances):
-            name = instance.get('name', 'Unknown')
-            zone = instance.get('zone', '').split('/')[-1] if instance.get('zone') else 'Unknown'
-            status = instance.get('status', 'Unknown')
-            machine_type = instance.get('machineType', '').split('/')[-1] if instance.get('machineType') else 'Unknown'
-            
-            choice_text = f"{name} ({status}) - {zone} - {machine_type}"
-            choices.append((choice_text, instance))
+        for instance in instances:
+            choice_text = (
+                f"{instance.get('name') or 'Unknown'} ({instance.get('status') or 'Unknown'}) - "
+                f"{instance.get('zone') or 'Unknown'} - {instance.get('machineType') or 'Unknown'}"
+            )
+            choices.append(questionary.Choice(choice_text, value=instance))
         
         # Add back option
-        choices.append(("← Back to main menu", None))
-        
-        question = inquirer.List(
-            'instance',
-            message=f"Select an instance to {action.lower()}:",
-            choices=choices
-        )
+        choices.append(questionary.Choice(BACK_CHOICE))
         
         try:
-            answer = inquirer.prompt([question])
-            if answer and answer['instance']:
-                return answer['instance']
+            answer = questionary.select(f"Select an instance to {action.lower()}:", choices=choices).ask()
+            if answer not in (None, BACK_CHOICE):
+                return answer
         except Exception as e:
             self.console.print(f"[red]❌ Error in interactive selection: {e}[/red]")
         
         return None
     
-    def start_instance(self, instance_name: str, zone: str, project_id: str, wait: bool = False, args: argparse.Namespace = None) -> bool:
-        """Start a VM instance."""
+    def start_instance(self, instance_name: str, zone: str, project_id: str, verify: bool = False, args: argparse.Namespace = None) -> bool:
+        """Start a VM instance.
+        
+        gcloud returns once the start operation has finished; pass verify to also poll until RUNNING is reported.
+        """
         try:
             self.console.print(f"[yellow]🚀 Starting instance '{instance_name}' in zone '{zone}'...[/yellow]")
+            self._invalidate_caches(project_id)
             
             cmd = [
                 "gcloud", "compute", "instances", "start",
@@ -293,12 +509,12 @@ class GCPVMManager:
                 "--project", project_id
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = _submit_gcloud(cmd, timeout=60, text=False, capture_stdout=False)
             
             if result.returncode == 0:
                 self.console.print(f"[green]✅ Instance '{instance_name}' started successfully![/green]")
                 
-                if wait:
+                if verify:
                     self.wait_for_instance_status(instance_name, zone, project_id, "RUNNING")
 
                 # Get instance details to find the external IP
@@ -318,7 +534,7 @@ class GCPVMManager:
                 
                 return True
             else:
-                self.console.print(f"[red]❌ Failed to start instance: {result.stderr}[/red]")
+                self.console.print(f"[red]❌ Failed to start instance: {result.stderr.decode('utf-8', 'replace')}[/red]")
                 return False
                 
         except subprocess.TimeoutExpired:
@@ -328,10 +544,14 @@ class GCPVMManager:
             self.console.print(f"[red]❌ Error starting instance: {e}[/red]")
             return False
     
-    def stop_instance(self, instance_name: str, zone: str, project_id: str, wait: bool = False) -> bool:
-        """Stop a VM instance."""
+    def stop_instance(self, instance_name: str, zone: str, project_id: str, verify: bool = False) -> bool:
+        """Stop a VM instance.
+        
+        gcloud returns once the stop operation has finished; pass verify to also poll until TERMINATED is reported.
+        """
         try:
             self.console.print(f"[yellow]🛑 Stopping instance '{instance_name}' in zone '{zone}'...[/yellow]")
+            self._invalidate_caches(project_id)
             
             cmd = [
                 "gcloud", "compute", "instances", "stop",
@@ -340,17 +560,17 @@ class GCPVMManager:
                 "--project", project_id
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = _submit_gcloud(cmd, timeout=60, text=False, capture_stdout=False)
             
             if result.returncode == 0:
                 self.console.print(f"[green]✅ Instance '{instance_name}' stopped successfully![/green]")
                 
-                if wait:
+                if verify:
                     self.wait_for_instance_status(instance_name, zone, project_id, "TERMINATED")
                 
                 return True
             else:
-                self.console.print(f"[red]❌ Failed to stop instance: {result.stderr}[/red]")
+                self.console.print(f"[red]❌ Failed to stop instance: {result.stderr.decode('utf-8', 'replace')}[/red]")
                 return False
                 
         except subprocess.TimeoutExpired:
@@ -360,47 +580,80 @@ class GCPVMManager:
             self.console.print(f"[red]❌ Error stopping instance: {e}[/red]")
             return False
     
-    def wait_for_instance_status(self, instance_name: str, zone: str, project_id: str, target_status: str, max_wait: int = 300):
-        """Wait for instance to reach target status."""
-        self.console.print(f"[blue]⏳ Waiting for instance to reach status '{target_status}'...[/blue]")
+    def _poll_statuses(self, instance_names: List[str], zone: Optional[str], project_id: str) -> Dict[str, str]:
+        """Fetch the current status of several instances with a single gcloud call."""
+        name_filter = " OR ".join(instance_names)
+        cmd = [
+            "gcloud", "compute", "instances", "list",
+            "--project", project_id,
+            "--filter", f"name=({name_filter})",
+            "--format", "value(name,status)"
+        ]
+        
+        if zone:
+            cmd.extend(["--zones", zone])
+        
+        result = run_gcloud(cmd, timeout=30)
+        
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip())
+        
+        statuses = {}
+        for line in result.stdout.splitlines():
+            fields = line.split()
+            if len(fields) == 2:
+                statuses[fields[0]] = fields[1]
+        return statuses
+    
+    def wait_for_instance_status(self, instance_names, zone: Optional[str], project_id: str, target_status: str, max_wait: int = 300) -> bool:
+        """Wait for one or more instances to reach target status."""
+        if isinstance(instance_names, str):
+            instance_names = [instance_names]
+        
+        target_status = target_status.upper()
+        pending = set(instance_names)
+        
+        if len(pending) == 1:
+            self.console.print(f"[blue]⏳ Waiting for instance to reach status '{target_status}'...[/blue]")
+        else:
+            self.console.print(f"[blue]⏳ Waiting for {len(pending)} instances to reach status '{target_status}'...[/blue]")
         
+        attempt = 0
+        last_statuses = {}
         start_time = time.time()
         while time.time() - start_time < max_wait:
             try:
-                cmd = [
-                    "gcloud", "compute", "instances", "describe",
-                    instance_name,
-                    "--zone", zone,
-                    "--project", project_id,
-                    "--format", "value(status)"
-                ]
+                statuses = self._poll_statuses(sorted(pending), zone, project_id)
                 
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+                # Poll quickly again while instances are still changing state
+                attempt = 0 if statuses != last_statuses else attempt + 1
+                last_statuses = statuses
                 
-                if result.returncode == 0:
-                    current_status = result.stdout.strip()
-                    if current_status.upper() == target_status.upper():
-                        self.console.print(f"[green]✅ Instance is now {target_status}[/green]")
-                        return True
+                for name, current_status in statuses.items():
+                    if current_status.upper() == target_status:
+                        pending.discard(name)
+                        self.console.print(f"[green]✅ Instance '{name}' is now {target_status}[/green]")
                     else:
-                        self.console.print(f"[blue]Current status: {current_status} (waiting for {target_status})[/blue]")
+                        self.console.print(f"[blue]Current status of '{name}': {current_status} (waiting for {target_status})[/blue]")
                 
-                time.sleep(5)
+                if not pending:
+                    return True
+                
+                time.sleep(_poll_delay(attempt))
                 
             except Exception as e:
                 self.console.print(f"[yellow]⚠️  Error checking status: {e}[/yellow]")
-                time.sleep(5)
+                attempt += 1
+                time.sleep(_poll_delay(attempt))
         
-        self.console.print(f"[yellow]⚠️  Timeout waiting for instance to reach {target_status}[/yellow]")
+        self.console.print(f"[yellow]⚠️  Timeout waiting for {', '.join(sorted(pending))} to reach {target_status}[/yellow]")
         return False
     
-    def create_instance(self, project_id: str, zone: str, instance_name: str = None, machine_type: str = "e2-micro", image_family: str = "ubuntu-2004-lts", image_project: str = "ubuntu-os-cloud", args: argparse.Namespace = None) -> bool:
-        """Create a new VM instance."""
+    def _submit_create(self, project_id: str, zone: str, instance_name: str, machine_type: str, image_family: str, image_project: str) -> Optional[str]:
+        """Submit an instance creation without waiting and return its operation name."""
         try:
-            if not instance_name:
-                instance_name = f"nebula-instance-{int(time.time())}"
-            
             self.console.print(f"[yellow]🚀 Creating instance '{instance_name}' in zone '{zone}'...[/yellow]")
+            self._invalidate_caches(project_id)
             
             cmd = [
                 "gcloud", "compute", "instances", "create", instance_name,
@@ -411,43 +664,135 @@ class GCPVMManager:
                 "--image-project", image_project,
                 "--boot-disk-size", "10GB",
                 "--boot-disk-type", "pd-standard",
-                "--format", "json"
+                "--async",
+                "--format", "value(name)"
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            result = _submit_gcloud(cmd, timeout=60)
             
-            if result.returncode == 0:
-                self.console.print(f"[green]✅ Instance '{instance_name}' created successfully![/green]")
-                
-                # Wait for instance to be running
-                self.wait_for_instance_status(instance_name, zone, project_id, "RUNNING")
-                
-                # Get instance details to find the external IP
-                # instance_details = self.get_instance_details(instance_name, zone, project_id)
-                # if instance_details:
-                #     external_ip = None
-                #     for network_interface in instance_details.get('networkInterfaces', []):
-                #         access_configs = network_interface.get('accessConfigs', [])
-                #         if access_configs:
-                #             external_ip = access_configs[0].get('natIP')
-                #             break
-                    
-                #     if external_ip:
-                #         handle_ssh_config_update(instance_details['id'], instance_name, external_ip, args)
-                #     else:
-                #         self.console.print("[yellow]⚠️  Could not find external IP for the instance.[/yellow]")
-                
-                return True
-            else:
+            if result.returncode != 0 or not result.stdout.strip():
                 self.console.print(f"[red]❌ Failed to create instance: {result.stderr}[/red]")
-                return False
-                
+                return None
+            
+            return result.stdout.strip()
+            
         except subprocess.TimeoutExpired:
             self.console.print("[red]❌ Create operation timed out[/red]")
-            return False
+            return None
         except Exception as e:
             self.console.print(f"[red]❌ Error creating instance: {e}[/red]")
+            return None
+    
+    def _wait_for_operations(self, operation_names: List[str], zone: Optional[str], project_id: str, max_wait: int = 300) -> Dict[str, bool]:
+        """Wait for compute operations to finish, polling all of them with one gcloud call per cycle."""
+        results = {}
+        pending = set(operation_names)
+        
+        start_time = time.time()
+        while pending and time.time() - start_time < max_wait:
+            try:
+                cmd = [
+                    "gcloud", "compute", "operations", "list",
+                    "--project", project_id,
+                    "--filter", f"name=({' OR '.join(sorted(pending))})",
+                    "--format", "value(name,status,error.errors[0].message)"
+                ]
+                
+                if zone:
+                    cmd.extend(["--zones", zone])
+                
+                result = run_gcloud(cmd, timeout=30)
+                
+                if result.returncode != 0:
+                    raise RuntimeError(result.stderr.strip())
+                
+                for line in result.stdout.splitlines():
+                    name, status, error = (line.split("\t") + ["", ""])[:3]
+                    if name in pending and status == "DONE":
+                        pending.discard(name)
+                        results[name] = not error
+                        if error:
+                            self.console.print(f"[red]❌ Operation '{name}' failed: {error}[/red]")
+                
+                if pending:
+                    time.sleep(5)
+                
+            except Exception as e:
+                self.console.print(f"[yellow]⚠️  Error checking operations: {e}[/yellow]")
+                time.sleep(5)
+        
+        for name in pending:
+            self.console.print(f"[yellow]⚠️  Timeout waiting for operation '{name}'[/yellow]")
+            results[name] = False
+        
+        return results
+    
+    def create_instance(self, project_id: str, zone: str, instance_name: str = None, machine_type: str = "e2-micro", image_family: str = "ubuntu-2004-lts", image_project: str = "ubuntu-os-cloud", args: argparse.Namespace = None) -> bool:
+        """Create a new VM instance."""
+        if not instance_name:
+            instance_name = f"nebula-instance-{int(time.time())}"
+        
+        operation = self._submit_create(project_id, zone, instance_name, machine_type, image_family, image_project)
+        if not operation:
+            return False
+        
+        # The insert operation completes once the instance has been created and booted
+        self.console.print(f"[blue]⏳ Waiting for instance '{instance_name}' to be created...[/blue]")
+        if not self._wait_for_operations([operation], zone, project_id).get(operation):
             return False
+        
+        self.console.print(f"[green]✅ Instance '{instance_name}' created successfully![/green]")
+        
+        # Get instance details to find the external IP
+        # instance_details = self.get_instance_details(instance_name, zone, project_id)
+        # if instance_details:
+        #     external_ip = None
+        #     for network_interface in instance_details.get('networkInterfaces', []):
+        #         access_configs = network_interface.get('accessConfigs', [])
+        #         if access_configs:
+        #             external_ip = access_configs[0].get('natIP')
+        #             break
+            
+        #     if external_ip:
+        #         handle_ssh_config_update(instance_details['id'], instance_name, external_ip, args)
+        #     else:
+        #         self.console.print("[yellow]⚠️  Could not find external IP for the instance.[/yellow]")
+        
+        return True
+    
+    def create_all_instances(self, project_id: str, specs: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """Create several instances, submitting every creation before waiting on any of them.
+        
+        Each spec needs 'instance_name' and 'zone' and may set 'machine_type',
+        'image_family' and 'image_project'.
+        """
+        results = {}
+        operations = {}
+        
+        for spec in specs:
+            instance_name = spec['instance_name']
+            operation = self._submit_create(
+                project_id,
+                spec['zone'],
+                instance_name,
+                spec.get('machine_type', "e2-micro"),
+                spec.get('image_family', "ubuntu-2004-lts"),
+                spec.get('image_project', "ubuntu-os-cloud")
+            )
+            if operation:
+                operations[operation] = instance_name
+            else:
+                results[instance_name] = False
+        
+        if operations:
+            self.console.print(f"[blue]⏳ Waiting for {len(operations)} instances to be created...[/blue]")
+            completed = self._wait_for_operations(list(operations), None, project_id)
+            for operation, instance_name in operations.items():
+                results[instance_name] = completed.get(operation, False)
+        
+        successful_creates = sum(1 for success in results.values() if success)
+        self.console.print(f"[green]✅ Successfully created {successful_creates}/{len(specs)} instances[/green]")
+        return results
 
     def confirm_action(self, action: str, instance_name: str, zone: str) -> bool:
         """Ask for confirmation before performing destructive actions."""
@@ -456,19 +801,95 @@ class GCPVMManager:
             self.console.print("[yellow]This will power off the instance. Are you sure?[/yellow]")
             
             try:
-                question = inquirer.Confirm('confirm', message="Do you want to continue?")
-                answer = inquirer.prompt([question])
-                return answer and answer.get('confirm', False)
+                return bool(questionary.confirm("Do you want to continue?", default=False).ask())
             except Exception:
-                # Fallback to simple input if inquirer fails
+                # Fallback to simple input if questionary fails
                 response = input("Type 'yes' to confirm: ").strip().lower()
                 return response == 'yes'
         
         return True
     
-    def start_all_instances(self, project_id: str, zone: Optional[str] = None, wait: bool = False) -> Dict[str, bool]:
-        """Start all terminated instances."""
-        instances = self.list_instances(project_id, zone, "TERMINATED")
+    def _submit_power_operations(self, verb: str, instance_names: List[str], zone: str, project_id: str) -> Dict[str, str]:
+        """Submit an asynchronous start/stop for instances in one zone and map each operation name to its instance.
+        
+        When gcloud is rate limited, only the instances without an accepted operation are resubmitted.
+        """
+        self._invalidate_caches(project_id)
+        
+        operations = {}
+        pending = list(instance_names)
+        
+        for attempt in range(SUBMIT_RETRIES + 1):
+            cmd = [
+                "gcloud", "compute", "instances", verb,
+                *pending,
+                "--zone", zone,
+                "--project", project_id,
+                "--async",
+                "--format", "value(name,targetLink.basename())"
+            ]
+            
+            result = run_gcloud(cmd, timeout=60)
+            
+            for line in result.stdout.splitlines():
+                fields = line.split("\t")
+                if len(fields) == 2:
+                    operations[fields[0]] = fields[1]
+            
+            accepted = set(operations.values())
+            pending = [name for name in pending if name not in accepted]
+            if result.returncode == 0 or not pending or not _is_rate_limited(result.stderr) or attempt == SUBMIT_RETRIES:
+                break
+            time.sleep(_poll_delay(attempt))
+        
+        if result.returncode != 0:
+            self.console.print(f"[red]❌ Failed to {verb} instances in zone '{zone}': {result.stderr}[/red]")
+        
+        return operations
+    
+    def _run_parallel(self, verb: str, instances: List[Dict[str, Any]], project_id: str, timeout: float = BULK_OPERATION_TIMEOUT) -> Dict[str, bool]:
+        """Start or stop instances in bulk: submit one asynchronous gcloud call per zone, then wait on every operation together."""
+        results = {instance.get('name'): False for instance in instances}
+        
+        names_by_zone: Dict[str, List[str]] = {}
+        for instance in instances:
+            names_by_zone.setdefault(instance.get('zone', ''), []).append(instance.get('name'))
+        
+        operations: Dict[str, str] = {}
+        executor = self._get_executor()
+        start_time = time.monotonic()
+        futures = []
+        
+        try:
+            futures = [
+                executor.submit(self._submit_power_operations, verb, names, zone, project_id)
+                for zone, names in names_by_zone.items()
+            ]
+            
+            for future in as_completed(futures, timeout=timeout):
+                try:
+                    operations.update(future.result())
+                except Exception as e:
+                    self.console.print(f"[red]❌ Error submitting {verb} operations: {e}[/red]")
+        except FutureTimeoutError:
+            self.console.print(f"[yellow]⚠️  Bulk operation did not finish within {timeout}s; unfinished instances are reported as failed[/yellow]")
+        finally:
+            # The pool outlives this batch, so only drop its submissions that never started
+            for future in futures:
+                future.cancel()
+        
+        if operations:
+            remaining = max(1, int(timeout - (time.monotonic() - start_time)))
+            completed = self._wait_for_operations(list(operations), None, project_id, max_wait=remaining)
+            for operation, instance_name in operations.items():
+                results[instance_name] = completed.get(operation, False)
+        
+        return results
+    
+    def start_all_instances(self, project_id: str, zone: Optional[str] = None, verify: bool = False, instances: Optional[List[Dict[str, Any]]] = None) -> Dict[str, bool]:
+        """Start all terminated instances, or the given already-listed terminated instances."""
+        if instances is None:
+            instances = self.list_instances(project_id, zone, "TERMINATED")
         
         if not instances:
             self.console.print("[yellow]No terminated instances found to start.[/yellow]")
@@ -476,27 +897,20 @@ class GCPVMManager:
         
         self.console.print(f"[blue]🚀 Starting {len(instances)} terminated instances...[/blue]")
         
-        results = {}
-        successful_starts = 0
+        results = self._run_parallel("start", instances, project_id)
+        successful_starts = sum(1 for success in results.values() if success)
         
-        for instance in instances:
-            instance_name = instance.get('name')
-            instance_zone = instance.get('zone', '').split('/')[-1]
-            
-            self.console.print(f"[yellow]Starting {instance_name} in {instance_zone}...[/yellow]")
-            
-            success = self.start_instance(instance_name, instance_zone, project_id, wait)
-            results[instance_name] = success
-            
-            if success:
-                successful_starts += 1
+        if verify and successful_starts:
+            started = [name for name, success in results.items() if success]
+            self.wait_for_instance_status(started, zone, project_id, "RUNNING")
         
         self.console.print(f"[green]✅ Successfully started {successful_starts}/{len(instances)} instances[/green]")
         return results
     
-    def stop_all_instances(self, project_id: str, zone: Optional[str] = None, wait: bool = False) -> Dict[str, bool]:
-        """Stop all running instances."""
-        instances = self.list_instances(project_id, zone, "RUNNING")
+    def stop_all_instances(self, project_id: str, zone: Optional[str] = None, verify: bool = False, instances: Optional[List[Dict[str, Any]]] = None) -> Dict[str, bool]:
+        """Stop all running instances, or the given already-listed running instances."""
+        if instances is None:
+            instances = self.list_instances(project_id, zone, "RUNNING")
         
         if not instances:
             self.console.print("[yellow]No running instances found to stop.[/yellow]")
@@ -504,77 +918,67 @@ class GCPVMManager:
         
         self.console.print(f"[blue]🛑 Stopping {len(instances)} running instances...[/blue]")
         
-        results = {}
-        successful_stops = 0
+        results = self._run_parallel("stop", instances, project_id)
+        successful_stops = sum(1 for success in results.values() if success)
         
-        for instance in instances:
-            instance_name = instance.get('name')
-            instance_zone = instance.get('zone', '').split('/')[-1]
-            
-            self.console.print(f"[yellow]Stopping {instance_name} in {instance_zone}...[/yellow]")
-            
-            success = self.stop_instance(instance_name, instance_zone, project_id, wait)
-            results[instance_name] = success
-            
-            if success:
-                successful_stops += 1
+        if verify and successful_stops:
+            stopped = [name for name, success in results.items() if success]
+            self.wait_for_instance_status(stopped, zone, project_id, "TERMINATED")
         
         self.console.print(f"[green]✅ Successfully stopped {successful_stops}/{len(instances)} instances[/green]")
         return results
     
     def run_interactive_mode(self, project_id: str, zone: Optional[str] = None):
         """Run the tool in interactive mode."""
+        # Fetch every instance once and serve the list views from memory until something changes
+        all_instances = self.list_instances(project_id, zone)
+        fetched_at = time.monotonic()
+        
         while True:
+            if all_instances is not None:
+                self.console.print(f"[dim]cache age: {int(time.monotonic() - fetched_at)}s[/dim]")
+            
             # Main menu
-            main_menu = [
-                inquirer.List(
-                    'action',
-                    message="What would you like to do?",
-                    choices=[
-                        'List All Instances',
-                        'List Running Instances',
-                        'List Terminated Instances',
-                        'Create Instance',
-                        'Start Instance',
-                        'Stop Instance',
-                        'Start All Instances',
-                        'Stop All Instances',
-                        'Exit'
-                    ],
-                ),
-            ]
+            main_menu = questionary.select(
+                "What would you like to do?",
+                choices=[
+                    'List All Instances',
+                    'List Running Instances',
+                    'List Terminated Instances',
+                    'Create Instance',
+                    'Start Instance',
+                    'Stop Instance',
+                    'Start All Instances',
+                    'Stop All Instances',
+                    'Exit'
+                ],
+            )
             
             try:
-                answers = inquirer.prompt(main_menu)
-                if not answers or answers['action'] == 'Exit':
+                action = main_menu.ask()
+                if not action or action == 'Exit':
                     break
                 
-                action = answers['action']
-                
-                if action == 'List All Instances':
-                    instances = self.list_instances(project_id, zone)
-                    self.display_instances_table(instances, "All VM Instances")
-                
-                elif action == 'List Running Instances':
-                    instances = self.list_instances(project_id, zone, "RUNNING")
-                    self.display_instances_table(instances, "Running VM Instances")
-                
-                elif action == 'List Terminated Instances':
-                    instances = self.list_instances(project_id, zone, "TERMINATED")
-                    self.display_instances_table(instances, "Terminated VM Instances")
+                if action in _LIST_VIEWS:
+                    if all_instances is None:
+                        all_instances = self.list_instances(project_id, zone)
+                        fetched_at = time.monotonic()
+                    
+                    status, title = _LIST_VIEWS[action]
+                    self.display_instances_table(_filter_instances(all_instances, status), title)
                 
                 elif action == 'Create Instance':
                     # Prompt for instance creation parameters
-                    instance_name = inquirer.text("Enter instance name (or press Enter for auto-generated):")
+                    instance_name = questionary.text("Enter instance name (or press Enter for auto-generated):").ask() or ""
                     if not instance_name.strip():
                         instance_name = None
                     
-                    zone_choice = inquirer.text("Enter zone (e.g., us-central1-a):")
+                    zone_choice = questionary.text("Enter zone (e.g., us-central1-a):").ask() or ""
                     if not zone_choice.strip():
                         self.console.print("[red]❌ Zone is required for instance creation.[/red]")
                         continue
                     
-                    machine_type = inquirer.text("Enter machine type (default: e2-micro):")
+                    machine_type = questionary.text("Enter machine type (default: e2-micro):").ask() or ""
                     if not machine_type.strip():
                         machine_type = "e2-micro"
                     
@@ -591,9 +995,9 @@ class GCPVMManager:
                     selected_instance = self.select_instance_interactive(instances, "start")
                     if selected_instance:
                         instance_name = selected_instance.get('name')
-                        instance_zone = selected_instance.get('zone', '').split('/')[-1]
+                        instance_zone = selected_instance.get('zone', '')
                         
-                        if self.start_instance(instance_name, instance_zone, project_id, wait=True):
+                        if self.start_instance(instance_name, instance_zone, project_id):
                             self.console.print(f"[green]🎉 Instance '{instance_name}' is now running![/green]")
                 
                 elif action == 'Stop Instance':
@@ -606,10 +1010,10 @@ class GCPVMManager:
                     selected_instance = self.select_instance_interactive(instances, "stop")
                     if selected_instance:
                         instance_name = selected_instance.get('name')
-                        instance_zone = selected_instance.get('zone', '').split('/')[-1]
+                        instance_zone = selected_instance.get('zone', '')
                         
                         if self.confirm_action("stop", instance_name, instance_zone):
-                            if self.stop_instance(instance_name, instance_zone, project_id, wait=True):
+                            if self.stop_instance(instance_name, instance_zone, project_id):
                                 self.console.print(f"[green]🎉 Instance '{instance_name}' has been stopped![/green]")
                         else:
                             self.console.print("[yellow]Operation cancelled.[/yellow]")
@@ -625,7 +1029,7 @@ class GCPVMManager:
                     self.display_instances_table(instances, "Instances to Start")
                     
                     if self.confirm_action("start all", f"{len(instances)} instances", "all zones"):
-                        results = self.start_all_instances(project_id, zone, wait=True)
+                        results = self.start_all_instances(project_id, zone, instances=instances)
                         successful = sum(1 for success in results.values() if success)
                         self.console.print(f"[green]🎉 Successfully started {successful}/{len(instances)} instances![/green]")
                     else:
@@ -642,12 +1046,16 @@ class GCPVMManager:
                     self.display_instances_table(instances, "Instances to Stop")
                     
                     if self.confirm_action("stop all", f"{len(instances)} instances", "all zones"):
-                        results = self.stop_all_instances(project_id, zone, wait=True)
+                        results = self.stop_all_instances(project_id, zone, instances=instances)
                         successful = sum(1 for success in results.values() if success)
                         self.console.print(f"[green]🎉 Successfully stopped {successful}/{len(instances)} instances![/green]")
                     else:
                         self.console.print("[yellow]Operation cancelled.[/yellow]")
                 
+                if action not in _LIST_VIEWS:
+                    # Instances may have changed state; refetch before the next list view
+                    all_instances = None
+                
                 self.console.print()  # Add spacing
                 
             except KeyboardInterrupt:
@@ -690,41 +1098,27 @@ class GCPVMManager:
             )
         
         elif args.start_instance:
-            # Find the instance to start
-            all_instances = self.list_instances(project_id, zone)
-            instances = [inst for inst in all_instances if inst.get('status', '').upper() == "TERMINATED"]
-            print("Terminated instances:", instances)
-            target_instance = None
-            
-            for instance in instances:
-                if instance.get('name') == args.start_instance:
-                    target_instance = instance
-                    break
+            # Let gcloud find the instance instead of listing the whole project
+            instances = self.list_instances(project_id, zone, "TERMINATED", name=args.start_instance)
+            target_instance = next((inst for inst in instances if inst.get('name') == args.start_instance), None)
             
             if not target_instance:
                 self.console.print(f"[red]❌ Instance '{args.start_instance}' not found in terminated instances.[/red]")
                 return False
             
-            instance_zone = target_instance.get('zone', '').split('/')[-1]
+            instance_zone = target_instance.get('zone', '')
             return self.start_instance(args.start_instance, instance_zone, project_id, args.wait, args)
         
         elif args.stop_instance:
-            # Find the instance to stop
-            all_instances = self.list_instances(project_id, zone)
-            instances = [inst for inst in all_instances if inst.get('status', '').upper() == "RUNNING"]
-            print("Running instances:", instances)
-            target_instance = None
-            
-            for instance in instances:
-                if instance.get('name') == args.stop_instance:
-                    target_instance = instance
-                    break
+            # Let gcloud find the instance instead of listing the whole project
+            instances = self.list_instances(project_id, zone, "RUNNING", name=args.stop_instance)
+            target_instance = next((inst for inst in instances if inst.get('name') == args.stop_instance), None)
             
             if not target_instance:
                 self.console.print(f"[red]❌ Instance '{args.stop_instance}' not found in running instances.[/red]")
                 return False
             
-            instance_zone = target_instance.get('zone', '').split('/')[-1]
+            instance_zone = target_instance.get('zone', '')
             
             if args.yes or self.confirm_action("stop", args.stop_instance, instance_zone):
                 return self.stop_instance(args.stop_instance, instance_zone, project_id, args.wait)
@@ -743,7 +1137,7 @@ class GCPVMManager:
             self.display_instances_table(instances, "Instances to Start")
             
             if args.yes or self.confirm_action("start all", f"{len(instances)} instances", "all zones"):
-                results = self.start_all_instances(project_id, zone, args.wait)
+                results = self.start_all_instances(project_id, zone, args.wait, instances)
                 successful = sum(1 for success in results.values() if success)
                 self.console.print(f"[green]✅ Successfully started {successful}/{len(instances)} instances[/green]")
                 return successful == len(instances)
@@ -762,7 +1156,7 @@ class GCPVMManager:
             self.display_instances_table(instances, "Instances to Stop")
             
             if args.yes or self.confirm_action("stop all", f"{len(instances)} instances", "all zones"):
-                results = self.stop_all_instances(project_id, zone, args.wait)
+                results = self.stop_all_instances(project_id, zone, args.wait, instances)
                 successful = sum(1 for success in results.values() if success)
                 self.console.print(f"[green]✅ Successfully stopped {successful}/{len(instances)} instances[/green]")
                 return successful == len(instances)
@@ -806,7 +1200,7 @@ Examples:
   # Stop all running instances
   python main.py --stop-all --yes --wait
   
-  # Wait for operation to complete
+  # Confirm the instance reports RUNNING after the start completes
   python main.py --start-instance my-instance --wait
         """
     )
@@ -830,9 +1224,12 @@ Examples:
     parser.add_argument('--start-all', action='store_true', help='Start all terminated instances')
     parser.add_argument('--stop-all', action='store_true', help='Stop all running instances')
     parser.add_argument('--yes', action='store_true', help='Skip confirmation prompts')
-    parser.add_argument('--wait', action='store_true', help='Wait for operation to complete')
+    parser.add_argument('--wait', action='store_true', help='After starting or stopping, poll until the final instance status is reported')
     parser.add_argument('--ssh-user', type=str, help='User for SSH connection')
     parser.add_argument('--ssh-key-path', type=str, help='Path to private key for SSH connection')
+    parser.add_argument('--no-cache', action='store_true', help='Always query gcloud instead of reusing recent instance listings')
+    parser.add_argument('--cache-ttl', type=int, default=0, metavar='SECONDS', help='Reuse instance listings saved by earlier runs for this many seconds (default: 0, disabled)')
+    parser.add_argument('--force-auth-check', action='store_true', help='Re-check gcloud authentication even if a cached result is available')
     
     args = parser.parse_args()
     
@@ -849,42 +1246,41 @@ Examples:
     ])
     
     # Create and run the manager
-    manager = GCPVMManager()
-    
-    if headless_mode:
-        success = manager.run_headless_mode(args)
-        sys.exit(0 if success else 1)
-    else:
-        project_id = args.project or manager.get_project_id()
-        # Show available instances and usage instructions
-        print("🔍 GCP VM Manager - Available Instances")
-        print("=" * 50)
-        instances = manager.list_instances(project_id, args.zone)
-        manager.display_instances_table(instances, "Available VM Instances")
-        
-        print("\n📋 Available Operations:")
-        print("  --list-all          List all instances")
-        print("  --list-running      List running instances")
-        print("  --list-terminated   List terminated instances")
-        print("  --create-instance   Create a new instance")
-        print("  --start-all         Start all terminated instances")
-        print("  --stop-all          Stop all running instances")
-        print("  --start-instance    Start a specific instance")
-        print("  --stop-instance     Stop a specific instance")
-        print("  --help              Show all options")
-        print("\n💡 Examples:")
-        print("  python main.py --create-instance my-instance --zone us-central1-a")
-        print("  python main.py --start-all --wait")
-        print("  python main.py --stop-all --yes --wait")
-        print("  python main.py --list-running")
-        
-        # Try interactive mode as fallback
-        try:
-            print("\n🔄 Starting interactive mode...")
-            manager.run_interactive_mode(project_id, args.zone)
-        except Exception as e:
-            print(f"\n⚠️  Interactive mode unavailable: {e}")
-            print("Please use command-line arguments for operations.")
+    with GCPVMManager(force_auth_check=args.force_auth_check, use_cache=not args.no_cache, cache_ttl=args.cache_ttl) as manager:
+        if headless_mode:
+            success = manager.run_headless_mode(args)
+            sys.exit(0 if success else 1)
+        else:
+            project_id = args.project or manager.get_project_id()
+            # Show available instances and usage instructions
+            print("🔍 GCP VM Manager - Available Instances")
+            print("=" * 50)
+            instances = manager.list_instances(project_id, args.zone)
+            manager.display_instances_table(instances, "Available VM Instances")
+            
+            print("\n📋 Available Operations:")
+            print("  --list-all          List all instances")
+            print("  --list-running      List running instances")
+            print("  --list-terminated   List terminated instances")
+            print("  --create-instance   Create a new instance")
+            print("  --start-all         Start all terminated instances")
+            print("  --stop-all          Stop all running instances")
+            print("  --start-instance    Start a specific instance")
+            print("  --stop-instance     Stop a specific instance")
+            print("  --help              Show all options")
+            print("\n💡 Examples:")
+            print("  python main.py --create-instance my-instance --zone us-central1-a")
+            print("  python main.py --start-all --wait")
+            print("  python main.py --stop-all --yes --wait")
+            print("  python main.py --list-running")
+            
+            # Try interactive mode as fallback
+            try:
+                print("\n🔄 Starting interactive mode...")
+                manager.run_interactive_mode(project_id, args.zone)
+            except Exception as e:
+                print(f"\n⚠️  Interactive mode unavailable: {e}")
+                print("Please use command-line arguments for operations.")
 
 if __name__ == "__main__":
     main()
@@ -4,39 +4,105 @@ List GCP Workers Tool
 Lists Google Cloud Platform worker instances with detailed information including resource usage and public IPs
 """
 
+import os
+import re
 import sys
 import json
 import subprocess
 import argparse
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from pathlib import Path
 from typing import Dict, List, Optional, Any
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 from rich import print as rprint
 
+# The shared gcloud helpers live next to the tool directories
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from gcloud_common import PROJECT_ENV_VARS, gcloud_bin, json_loads, orjson, run_gcloud
+
 console = Console()
 
+# Instances whose name matches this pattern are treated as workers
+_WORKER_RE = re.compile(r"worker", re.IGNORECASE)
+
+# Only the instance fields used by get_instance_details are requested from gcloud
+_INSTANCE_FORMAT = "json(name,zone,status,machineType,networkInterfaces,labels,tags,creationTimestamp)"
+
+# Usage field -> Cloud Monitoring metric type checked by --show-metrics
+_USAGE_METRICS = {
+    'cpu_usage': "compute.googleapis.com/instance/cpu/utilization",
+    'memory_usage': "compute.googleapis.com/instance/memory/utilization",
+}
+
+# Status cells are built once and shared by every table row instead of re-parsing markup per row
+_RUNNING_CELL = Text("RUNNING", style="green")
+_STATUS_CELLS: Dict[str, Text] = {}
+
+
+def _status_cell(status: str) -> Text:
+    """Return the shared, colored status cell for a summary table row."""
+    if status == "RUNNING":
+        return _RUNNING_CELL
+    cell = _STATUS_CELLS.get(status)
+    if cell is None:
+        cell = _STATUS_CELLS[status] = Text(status, style="red")
+    return cell
+
+
+def _tail(url: str) -> str:
+    """Return the last path segment of a resource URL (e.g. the zone name of a zone URL)."""
+    return url[url.rfind('/') + 1:]
+
+
+@cache
+def _active_account() -> Optional[str]:
+    """Look up the active gcloud account once per process."""
+    result = run_gcloud(
+        ["gcloud", "auth", "list", "--filter=status:ACTIVE", "--format=value(account)"],
+        timeout=10
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+@cache
+def _gcloud_project() -> Optional[str]:
+    """Look up the configured gcloud project once per process."""
+    try:
+        result = run_gcloud(["gcloud", "config", "get-value", "project"], timeout=10)
+        if result.returncode == 0:
+            return result.stdout.strip() or None
+    except Exception:
+        pass
+    return None
+
+
 class ListGCPWorkers:
     def __init__(self):
         self.console = Console()
+        self._metric_usage: Dict[str, Dict[str, str]] = {}
+        self.show_metrics = False
         self.check_gcloud_auth()
     
     def check_gcloud_auth(self):
         """Check if gcloud is authenticated and configured."""
+        if not gcloud_bin():
+            self.console.print("[red]❌ gcloud CLI not found. Please install Google Cloud SDK first.[/red]")
+            self.console.print("[yellow]Install from: https://cloud.google.com/sdk/docs/install[/yellow]")
+            sys.exit(1)
+        
         try:
-            result = subprocess.run(
-                ["gcloud", "auth", "list", "--filter=status:ACTIVE", "--format=value(account)"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0 or not result.stdout.strip():
+            account = _active_account()
+            if not account:
                 self.console.print("[red]❌ gcloud not authenticated. Please run 'gcloud auth login' first.[/red]")
                 sys.exit(1)
             
-            account = result.stdout.strip()
             self.console.print(f"[green]✅ Authenticated as: {account}[/green]")
             
         except FileNotFoundError:
@@ -49,19 +115,13 @@ class ListGCPWorkers:
     
     def get_project_id(self) -> str:
         """Get the current GCP project ID."""
-        try:
-            result = subprocess.run(
-                ["gcloud", "config", "get-value", "project"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                project_id = result.stdout.strip()
-                if project_id:
-                    return project_id
-        except Exception:
-            pass
+        for env_var in PROJECT_ENV_VARS:
+            if os.environ.get(env_var):
+                return os.environ[env_var]
+        
+        project_id = _gcloud_project()
+        if project_id:
+            return project_id
         
         # Fallback: prompt user for project ID
         self.console.print("[yellow]⚠️  Could not determine project ID automatically.[/yellow]")
@@ -77,20 +137,20 @@ class ListGCPWorkers:
             cmd = [
                 "gcloud", "compute", "instances", "list",
                 "--project", project_id,
-                "--format", "json"
+                "--format", _INSTANCE_FORMAT
             ]
             
             if zone:
                 cmd.extend(["--zones", zone])
             
             self.console.print("[blue]🔍 Fetching VM instances...[/blue]")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = run_gcloud(cmd, timeout=30, text=False)
             
             if result.returncode != 0:
-                self.console.print(f"[red]❌ Failed to list instances: {result.stderr}[/red]")
+                self.console.print(f"[red]❌ Failed to list instances: {result.stderr.decode('utf-8', 'replace')}[/red]")
                 return []
             
-            instances = json.loads(result.stdout)
+            instances = json_loads(result.stdout)
             self.console.print(f"[green]✅ Found {len(instances)} instances[/green]")
             return instances
             
@@ -104,27 +164,21 @@ class ListGCPWorkers:
             self.console.print(f"[red]❌ Error listing instances: {e}[/red]")
             return []
     
-    def filter_worker_instances(self, instances: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Filter instances to only include workers (instances with 'worker' in the name)."""
-        worker_instances = []
-        
-        for instance in instances:
-            name = instance.get('name', '').lower()
-            if 'worker' in name:
-                worker_instances.append(instance)
-        
-        return worker_instances
+    def filter_worker_instances(self, instances: List[Dict[str, Any]], pattern: re.Pattern = _WORKER_RE) -> List[Dict[str, Any]]:
+        """Filter instances to only include workers (instances whose name matches pattern, by default containing 'worker')."""
+        search = pattern.search
+        return [instance for instance in instances if search(instance.get('name', ''))]
     
     def get_instance_details(self, instance: Dict[str, Any], project_id: str) -> Dict[str, Any]:
         """Get detailed information about a specific instance."""
         instance_name = instance.get('name', '')
-        zone = instance.get('zone', '').split('/')[-1]
+        zone = _tail(instance.get('zone', ''))
         
         details = {
             'name': instance_name,
             'zone': zone,
             'status': instance.get('status', 'UNKNOWN'),
-            'machine_type': instance.get('machineType', '').split('/')[-1],
+            'machine_type': _tail(instance.get('machineType', '')),
             'internal_ip': None,
             'external_ip': None,
             'cpu_usage': 'N/A',
@@ -139,8 +193,8 @@ class ListGCPWorkers:
         # Get network interface information
         for network_interface in instance.get('networkInterfaces', []):
             network_info = {
-                'network': network_interface.get('network', '').split('/')[-1],
-                'subnetwork': network_interface.get('subnetwork', '').split('/')[-1] if network_interface.get('subnetwork') else 'N/A',
+                'network': _tail(network_interface.get('network', '')),
+                'subnetwork': _tail(network_interface['subnetwork']) if network_interface.get('subnetwork') else 'N/A',
                 'internal_ip': network_interface.get('networkIP'),
                 'external_ip': network_interface.get('accessConfigs', [{}])[0].get('natIP') if network_interface.get('accessConfigs') else None
             }
@@ -152,55 +206,55 @@ class ListGCPWorkers:
             if not details['external_ip']:
                 details['external_ip'] = network_info['external_ip']
         
-        # Try to get resource usage metrics (requires monitoring API)
-        try:
-            details.update(self.get_resource_usage(instance_name, zone, project_id))
-        except Exception:
-            pass  # Resource usage is optional
+        # Try to get resource usage metrics (requires monitoring API); skipped
+        # unless requested, since it costs extra gcloud calls
+        if self.show_metrics:
+            try:
+                details.update(self.get_resource_usage(instance_name, zone, project_id))
+            except Exception:
+                pass  # Resource usage is optional
         
         return details
     
     def get_resource_usage(self, instance_name: str, zone: str, project_id: str) -> Dict[str, str]:
         """Get resource usage metrics for an instance."""
+        # Metric descriptors are defined per project, not per instance, so the
+        # availability check runs once per project and is shared by every instance
+        if project_id not in self._metric_usage:
+            self._metric_usage[project_id] = self._check_metric_availability(project_id)
+        return dict(self._metric_usage[project_id])
+    
+    def _check_metric_availability(self, project_id: str) -> Dict[str, str]:
+        """Check which compute instance metrics are available in the project."""
         usage = {
             'cpu_usage': 'N/A',
             'memory_usage': 'N/A',
             'disk_usage': 'N/A'
         }
         
-        try:
-            # Get CPU usage (last 1 hour average)
-            cpu_cmd = [
-                "gcloud", "monitoring", "metrics", "list",
-                "--project", project_id,
-                "--filter", f'metric.type="compute.googleapis.com/instance/cpu/utilization" AND resource.labels.instance_name="{instance_name}"',
-                "--format", "value(metric.type)"
-            ]
-            
-            result = subprocess.run(cpu_cmd, capture_output=True, text=True, timeout=15)
-            if result.returncode == 0 and result.stdout.strip():
-                usage['cpu_usage'] = "Available (use --show-metrics for details)"
-            
-        except Exception:
-            pass
+        # The metric lookups are independent, so run them side by side
+        with ThreadPoolExecutor(max_workers=len(_USAGE_METRICS)) as executor:
+            available = executor.map(lambda metric_type: self._metric_exists(project_id, metric_type), _USAGE_METRICS.values())
+            for key, exists in zip(_USAGE_METRICS, available):
+                if exists:
+                    usage[key] = "Available"
+        
+        return usage
+    
+    def _metric_exists(self, project_id: str, metric_type: str) -> bool:
+        """Return True if the project has a descriptor for the given metric type."""
+        cmd = [
+            "gcloud", "monitoring", "metrics", "list",
+            "--project", project_id,
+            "--filter", f'metric.type="{metric_type}"',
+            "--format", "value(metric.type)"
+        ]
         
         try:
-            # Get memory usage
-            memory_cmd = [
-                "gcloud", "monitoring", "metrics", "list",
-                "--project", project_id,
-                "--filter", f'metric.type="compute.googleapis.com/instance/memory/utilization" AND resource.labels.instance_name="{instance_name}"',
-                "--format", "value(metric.type)"
-            ]
-            
-            result = subprocess.run(memory_cmd, capture_output=True, text=True, timeout=15)
-            if result.returncode == 0 and result.stdout.strip():
-                usage['memory_usage'] = "Available (use --show-metrics for details)"
-            
+            result = run_gcloud(cmd, timeout=15)
+            return result.returncode == 0 and bool(result.stdout.strip())
         except Exception:
-            pass
-        
-        return usage
+            return False
     
     def display_worker_instances(self, worker_instances: List[Dict[str, Any]], show_details: bool = False):
         """Display worker instances in a formatted table."""
@@ -224,11 +278,10 @@ class ListGCPWorkers:
         table.add_column("External IP", style="red")
         
         for instance in worker_instances:
-            status_color = "green" if instance['status'] == 'RUNNING' else "red"
             table.add_row(
                 instance['name'],
                 instance['zone'],
-                f"[{status_color}]{instance['status']}[/{status_color}]",
+                _status_cell(instance['status']),
                 instance['machine_type'],
                 instance['internal_ip'] or 'N/A',
                 instance['external_ip'] or 'N/A'
@@ -238,6 +291,7 @@ class ListGCPWorkers:
     
     def display_detailed_table(self, worker_instances: List[Dict[str, Any]]):
         """Display detailed information about worker instances."""
+        renderables = []
         for i, instance in enumerate(worker_instances):
             # Create a panel for each instance
             title = f"Worker Instance: {instance['name']}"
@@ -261,17 +315,23 @@ Labels: {json.dumps(instance['labels'], indent=2) if instance['labels'] else 'No
 Tags: {json.dumps(instance['tags'], indent=2) if instance['tags'] else 'None'}
 """
             
-            panel = Panel(content, title=title, border_style="blue")
-            self.console.print(panel)
+            renderables.append(Panel(content, title=title, border_style="blue"))
             
             if i < len(worker_instances) - 1:
-                self.console.print()  # Add spacing between instances
+                renderables.append(Text())  # Add spacing between instances
+        
+        # Render every panel in a single print call
+        self.console.print(Group(*renderables))
     
     def export_to_json(self, worker_instances: List[Dict[str, Any]], filename: str):
         """Export worker instances data to JSON file."""
         try:
-            with open(filename, 'w') as f:
-                json.dump(worker_instances, f, indent=2, default=str)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(worker_instances, default=str, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(worker_instances, f, indent=2, default=str)
             self.console.print(f"[green]✅ Data exported to {filename}[/green]")
         except Exception as e:
             self.console.print(f"[red]❌ Failed to export data: {e}[/red]")
@@ -281,6 +341,7 @@ Tags: {json.dumps(instance['tags'], indent=2) if instance['tags'] else 'None'}
         try:
             # Get project ID
             project_id = args.project or self.get_project_id()
+            self.show_metrics = args.show_metrics
             self.console.print(f"[blue]🔍 Monitoring GCP project: {project_id}[/blue]")
             
             # List instances
@@ -290,7 +351,7 @@ Tags: {json.dumps(instance['tags'], indent=2) if instance['tags'] else 'None'}
                 return
             
             # Filter worker instances
-            worker_instances = self.filter_worker_instances(instances)
+            worker_instances = self.filter_worker_instances(instances, args.name_pattern)
             if not worker_instances:
                 self.console.print("[yellow]No worker instances found. Consider using --all-instances to see all instances.[/yellow]")
                 if args.all_instances:
@@ -299,11 +360,9 @@ Tags: {json.dumps(instance['tags'], indent=2) if instance['tags'] else 'None'}
                 else:
                     return
             
-            # Get detailed information for each worker instance
-            detailed_instances = []
-            for instance in worker_instances:
-                details = self.get_instance_details(instance, project_id)
-                detailed_instances.append(details)
+            # Get detailed information for each worker instance; this is built from the
+            # listing already in memory, so there is no per-instance I/O to overlap
+            detailed_instances = [self.get_instance_details(instance, project_id) for instance in worker_instances]
             
             # Display results
             self.display_worker_instances(detailed_instances, args.detailed)
@@ -324,6 +383,13 @@ Tags: {json.dumps(instance['tags'], indent=2) if instance['tags'] else 'None'}
                 import traceback
                 traceback.print_exc()
 
+def _name_pattern(value: str) -> re.Pattern:
+    """Compile a --name-pattern argument as a case-insensitive regex."""
+    try:
+        return re.compile(value, re.IGNORECASE)
+    except re.error as e:
+        raise argparse.ArgumentTypeError(f"invalid regex '{value}': {e}")
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -340,12 +406,18 @@ Examples:
   # Show detailed information
   python main.py --detailed
   
+  # Check which resource metrics are available
+  python main.py --detailed --show-metrics
+  
   # Export data to JSON
   python main.py --export workers.json
   
   # Show all instances (not just workers)
   python main.py --all-instances
   
+  # Treat instances named like wrk-<n>-prod as workers
+  python main.py --name-pattern '^wrk-.*-prod$'
+  
   # Specify project ID
   python main.py --project my-project-id
         """
@@ -354,6 +426,8 @@ Examples:
     parser.add_argument('--project', help='GCP project ID (default: current project)')
     parser.add_argument('--zone', help='GCP zone to filter instances')
     parser.add_argument('--detailed', action='store_true', help='Show detailed information for each instance')
+    parser.add_argument('--show-metrics', action='store_true', help='Query Cloud Monitoring for resource usage metrics (slower)')
+    parser.add_argument('--name-pattern', type=_name_pattern, default=_WORKER_RE, metavar='REGEX', help="Case-insensitive regex that marks an instance as a worker (default: 'worker')")
     parser.add_argument('--all-instances', action='store_true', help='Show all instances, not just workers')
     parser.add_argument('--export', nargs='?', const='auto', metavar='FILENAME', help='Export data to JSON file (default: auto-generated filename)')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose error output')